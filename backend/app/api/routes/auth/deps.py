@@ -1,11 +1,14 @@
 import jwt
+from collections.abc import AsyncGenerator
 from typing import Annotated
 from fastapi import Depends,Cookie, HTTPException,status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.core.config import settings
 from backend.app.auth.models import User
-from backend.app.core.db import get_session
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.core.db import current_user_id, get_session, read_session_scope
 from backend.app.core.logging import get_logger
+from backend.app.core.user_cache import cache_user, get_cached_user
 
 logger = get_logger()
 
@@ -41,6 +44,12 @@ async def get_current_user(
         
         from backend.app.api.services.user_auth import user_auth_service
 
+        user = await get_cached_user(payload["id"])
+        if user:
+            await user_auth_service.validate_user_status(user)
+            current_user_id.set(user.id)
+            return user
+
         user = await user_auth_service.get_user_by_id(payload["id"], session)
         if not user:
             raise HTTPException(
@@ -52,6 +61,8 @@ async def get_current_user(
                 },
             )
         await user_auth_service.validate_user_status(user)
+        await cache_user(user)
+        current_user_id.set(user.id)
         return user
     
     except jwt.ExpiredSignatureError:
@@ -84,3 +95,25 @@ async def get_current_user(
         )
     
 CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+async def get_admin_user(current_user: CurrentUser) -> User:
+    if not (
+        current_user.is_superuser
+        or current_user.role in (RoleChoicesSchema.ADMIN, RoleChoicesSchema.SUPER_ADMIN)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Only administrators can access this resource",
+            },
+        )
+    return current_user
+
+
+async def get_user_read_session(
+        current_user: CurrentUser,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with read_session_scope(current_user.id) as session:
+        yield session
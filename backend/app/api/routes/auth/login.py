@@ -67,7 +67,7 @@ async def request_login_otp(
                 user, session, clear_otp=True, log_action=True
             )
 
-            await user_auth_service.generate_and_save_otp(user, session)
+            await user_auth_service.generate_and_save_otp(user)
 
         return {
                 "message": "if an account exists with this email, on OTP has been sent to it."
@@ -9,9 +9,6 @@ from backend.app.auth.schema import RoleChoicesSchema
 from backend.app.bank_account.schema import BankAccountReadSchema
 from backend.app.core.db import get_session
 from backend.app.core.db import get_logger
-from backend.app.core.services.bank_account_activated_email import (
-    send_account_activated_email,
-)
 
 logger = get_logger()
 
@@ -40,24 +37,6 @@ async def activate_account(
         activated_account, account_owner = await activate_bank_account(
             account_id=account_id, verified_by=current_user.id, session=session
         )
-        try:
-            if not activated_account.account_number:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={"status": "error", "message":"Account number not found"},
-                )
-            await send_account_activated_email(
-                email=account_owner.email,
-                full_name=account_owner.full_name,
-                account_number=activated_account.account_number,
-                account_name=activated_account.account_name,
-                account_type=activated_account.account_type.value,
-                currency=activated_account.currency.value,
-            )
-            logger.info(f"Bank Account activated email sent to {account_owner.email}")
-        except Exception as email_error:
-            logger.error(f"Failed to send bank account activated email: {email_error}")
-
         logger.info(
             f"Bank account {account_id} activated by account executinve {current_user.email}"
         )
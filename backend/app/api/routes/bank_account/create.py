@@ -6,9 +6,6 @@ from backend.app.api.services.bank_account import create_bank_account
 from backend.app.bank_account.schema import (BankAccountCreateSchema, BankAccountReadSchema)
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
-from backend.app.core.services.bank_account_created_email import (
-    send_account_created_email,
-)
 
 logger = get_logger()
 
@@ -30,28 +27,6 @@ async def create_account(
             user_id = current_user.id, account_data=account_data, session=session
         )
 
-        try:
-            if not account.account_number:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail={
-                        "status": "error",
-                        "message" : "Account number not generated",
-                    },
-                )
-            
-            await send_account_created_email(
-                email=current_user.email,
-                full_name=current_user.full_name,
-                account_number=account.account_number,
-                account_name=account.account_name,
-                account_type=account.account_type.value,
-                currency=account.currency.value,
-                identification_type=current_user.profile.means_of_identification.value,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send account creation email: {e}")
-
         logger.info(f"Created account for user {current_user.email}")
         return BankAccountReadSchema.model_validate(account)
     
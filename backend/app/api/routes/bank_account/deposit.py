@@ -1,23 +1,44 @@
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.routes.bank_account.deps import IdempotentRequest, idempotent
 from backend.app.api.services.transaction import process_deposit
 from backend.app.auth.schema import RoleChoicesSchema
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
-from backend.app.core.services.deposit_alert import send_deposit_alert
-from backend.app.transaction.enums import TransactionTypeEnum
+from backend.app.transaction.models import Transaction
 from backend.app.transaction.schema import DepositRequestSchema
 
 logger = get_logger()
 
 router =APIRouter(prefix="/bank-account")
 
+
+def build_deposit_response(transaction: Transaction) -> dict:
+    return {
+        "status": "success",
+        "message" : "Deposit processed successfully",
+        "data" : {
+            "transaction_id": str(transaction.id),
+            "reference": transaction.reference,
+            "amount": str(transaction.amount),
+            "balance" : str(transaction.balance_after),
+            "status" : transaction.status.value,
+        },
+    }
+
+
 @router.post("/deposit", status_code=status.HTTP_201_CREATED)
 async def carete_deposit(
     deposit_data: DepositRequestSchema,
     current_user: CurrentUser,
+    idempotency: Annotated[
+        IdempotentRequest,
+        Depends(idempotent("/deposit", status.HTTP_201_CREATED)),
+    ],
     session: AsyncSession = Depends(get_session),
 ):
     
@@ -27,6 +48,11 @@ async def carete_deposit(
             detail={"status": "error", "message": "Only tellers can process deposits"},
         )
     try:
+        if idempotency.cached_response is not None:
+            return idempotency.cached_response
+
+        idempotency.build_response = build_deposit_response
+
         transaction, account, account_owner = await process_deposit(
             amount=deposit_data.amount,
             account_id=deposit_data.account_id,
@@ -35,41 +61,7 @@ async def carete_deposit(
             session=session,
         )
 
-        if not account.account_number:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={"status":"error","message":"Account number is required"},
-            )
-        
-        try:
-            currency_value = account.currency.value
-            await send_deposit_alert(
-                email=account_owner.email,
-                full_name=account_owner.full_name,
-                action=TransactionTypeEnum.Deposit.value,
-                amount=transaction.amount,
-                account_name=account.account_name,
-                account_number=account.account_number,
-                currency=currency_value,
-                description=transaction.description,
-                transaction_date=transaction.completed_at or transaction.created_at,
-                reference=transaction.reference,
-                balance=transaction.balance_after
-            )
-        except Exception as email_error:
-            logger.error(f"Failed to send transaction alert: {email_error}")
-
-        return {
-            "status": "success",
-            "message" : "Deposit processed successfully",
-            "data" : {
-                "transaction_id": transaction.id,
-                "reference": transaction.reference,
-                "amount": transaction.amount,
-                "balance" : transaction.balance_after,
-                "status" : transaction.status,
-            },
-        }
+        return build_deposit_response(transaction)
     except HTTPException as http_ex:
         raise http_ex
     except Exception as e:
@@ -0,0 +1,183 @@
+import uuid
+from collections.abc import AsyncGenerator, Callable
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy import delete, event, null
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.core.config import settings
+from backend.app.core.db import get_session
+from backend.app.core.idempotency import get_idempotency_store
+from backend.app.core.logging import get_logger
+from backend.app.transaction.enums import TransactionStatusEnum
+from backend.app.transaction.models import IdempotencyKey, Transaction
+
+logger = get_logger()
+
+
+def validate_uuid4(value: str) -> str:
+    try:
+        uuid_obj = uuid.UUID(value, version=4)
+        if str(uuid_obj) != value.lower():
+            raise ValueError("Not a valid UUID v4")
+        return value
+    except (ValueError, AttributeError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Idempotency-Key must be a valid UUID v4",
+            },
+        )
+
+
+class IdempotentRequest:
+    def __init__(
+        self,
+        key: str,
+        endpoint: str,
+        user_id: uuid.UUID,
+        status_code: int,
+        cached_response: dict | None = None,
+    ):
+        self.key = key
+        self.endpoint = endpoint
+        self.user_id = user_id
+        self.status_code = status_code
+        self.cached_response = cached_response
+        self.build_response: Callable[[Transaction], dict] | None = None
+        self.response: dict | None = None
+
+    @property
+    def store_key(self) -> str:
+        return f"{self.user_id}:{self.endpoint}:{self.key}"
+
+    def _expires_at(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(
+            seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS
+        )
+
+    def _upsert(self, response_body: dict | None, only_expired: bool):
+        now = datetime.now(timezone.utc)
+        values = {
+            "user_id": self.user_id,
+            "endpoint": self.endpoint,
+            "response_code": self.status_code,
+            "response_body": null() if response_body is None else response_body,
+            "created_at": now,
+            "expires_at": self._expires_at(),
+        }
+        return (
+            pg_insert(IdempotencyKey)
+            .values(id=uuid.uuid4(), key=self.key, **values)
+            .on_conflict_do_update(
+                index_elements=[IdempotencyKey.key],
+                set_=values,
+                where=(IdempotencyKey.expires_at <= now) if only_expired else None,
+            )
+            .returning(IdempotencyKey.id)
+        )
+
+    async def reserve(self, session: AsyncSession) -> dict | None:
+        result = await session.exec(self._upsert(None, only_expired=True))
+        if result.first():
+            event.listen(session.sync_session, "before_commit", self._record_outcome)
+            return None
+
+        result = await session.exec(
+            select(IdempotencyKey).where(IdempotencyKey.key == self.key)
+        )
+        record = result.first()
+        if record is not None and (
+            record.user_id != self.user_id or record.endpoint != self.endpoint
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={
+                    "status": "error",
+                    "message": "Idempotency-Key was already used for a different request",
+                },
+            )
+        if record is None or record.response_body is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "status": "error",
+                    "message": "A request with this Idempotency-Key is already in progress",
+                },
+            )
+        return record.response_body
+
+    def _record_outcome(self, session: Session) -> None:
+        if self.response is not None:
+            return
+
+        transaction = next(
+            (
+                obj
+                for obj in session.new
+                if isinstance(obj, Transaction)
+                and obj.status != TransactionStatusEnum.Failed
+            ),
+            None,
+        )
+        if transaction is None or self.build_response is None:
+            session.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.key == self.key,
+                    col(IdempotencyKey.response_body).is_(None),
+                )
+            )
+            return
+
+        self.response = self.build_response(transaction)
+        session.execute(self._upsert(self.response, only_expired=False))
+
+
+def idempotent(
+    endpoint: str, status_code: int
+) -> Callable[..., AsyncGenerator[IdempotentRequest, None]]:
+    async def dependency(
+        current_user: CurrentUser,
+        session: AsyncSession = Depends(get_session),
+        idempotency_key: str = Header(
+            description="Idempotency Key for the request"
+        ),
+    ) -> AsyncGenerator[IdempotentRequest, None]:
+        request = IdempotentRequest(
+            key=validate_uuid4(idempotency_key),
+            endpoint=endpoint,
+            user_id=current_user.id,
+            status_code=status_code,
+        )
+
+        store = get_idempotency_store()
+        try:
+            request.cached_response = await store.get_response(request.store_key)
+        except Exception as e:
+            logger.warning(f"Idempotency cache lookup failed, using database: {e}")
+
+        if request.cached_response is None:
+            request.cached_response = await request.reserve(session)
+            if request.cached_response is not None:
+                await session.rollback()
+
+        yield request
+
+        replayed = request.cached_response
+        if request.response is not None or replayed is not None:
+            try:
+                await store.set_response(
+                    request.store_key,
+                    request.response if replayed is None else replayed,
+                    settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache idempotent response: {e}")
+
+    return dependency
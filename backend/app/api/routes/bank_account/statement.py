@@ -1,16 +1,22 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.app.api.routes.auth.deps import CurrentUser
-from backend.app.api.services.transaction import generate_user_statement
+from backend.app.api.routes.auth.deps import CurrentUser, get_user_read_session
+from backend.app.api.services.transaction import (
+    export_statement_rows,
+    generate_user_statement,
+    get_statement_account_ids,
+)
 from backend.app.bank_account.enums import AccountStatusEnum
 from backend.app.bank_account.models import BankAccount
 from backend.app.core.celery_app import celery_app
-from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
+from backend.app.core.statement_store import get_statement_store
+from backend.app.transaction.enums import StatementFormatEnum
 from backend.app.transaction.schema import (
     StatementRequestSchema,
     StatementResponseSchema
@@ -27,8 +33,8 @@ router = APIRouter(prefix="/bank-account")
 async def generate_satement(
     request: StatementRequestSchema,
     current_user: CurrentUser,
-    session: AsyncSession = Depends(get_session),
-) -> StatementResponseSchema:
+    session: AsyncSession = Depends(get_user_read_session),
+) -> StatementResponseSchema | StreamingResponse:
     logger.info(f"generate_statement start......")
     try:
         if request.start_date > request.end_date:
@@ -66,6 +72,38 @@ async def generate_satement(
                         "message":"Cannot generate statement for inactive account",
                     },
                 )
+        if request.format != StatementFormatEnum.PDF:
+            try:
+                await get_statement_account_ids(
+                    current_user.id, session, request.account_number
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={"status": "error", "message": str(e)},
+                )
+
+            media_type = (
+                "text/csv"
+                if request.format == StatementFormatEnum.CSV
+                else "application/x-ndjson"
+            )
+            filename = (
+                f"statement_{request.start_date:%Y%m%d}_{request.end_date:%Y%m%d}"
+                f".{request.format.value}"
+            )
+            return StreamingResponse(
+                export_statement_rows(
+                    user_id=current_user.id,
+                    start_date=request.start_date,
+                    end_date=request.end_date,
+                    statement_format=request.format,
+                    account_number=request.account_number,
+                ),
+                media_type=media_type,
+                headers={"Content-Disposition": f"attachment;filename={filename}"},
+            )
+
         result = await generate_user_statement(
             user_id = current_user.id,
             start_date = request.start_date,
@@ -77,11 +115,11 @@ async def generate_satement(
         celery_app.AsyncResult(result["task_id"])
 
         generated_at = datetime.now(timezone.utc)
-        expires_at = generated_at + timedelta(hours=1)
+        expires_at = datetime.fromisoformat(result["expires_at"])
 
         return StatementResponseSchema(
-            status="pending",
-            message="Statement generation initiated",
+            status=result["status"],
+            message=result["message"],
             task_id=result["task_id"],
             statement_id=result["statement_id"],
             generated_at=generated_at,
@@ -97,12 +135,47 @@ async def generate_satement(
             },
         )
     
+def parse_range_header(range_header: str | None, size: int) -> tuple[int, int] | None:
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    ranges = range_header[len("bytes="):].split(",")
+    if len(ranges) != 1:
+        return None
+
+    start_str, _, end_str = ranges[0].strip().partition("-")
+    try:
+        if not start_str:
+            suffix = int(end_str)
+            if suffix <= 0:
+                raise ValueError("Empty suffix range")
+            return max(size - suffix, 0), size - 1
+
+        start = int(start_str)
+        end = int(end_str) if end_str else size - 1
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={"status": "error", "message": "Invalid Range header"},
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={"status": "error", "message": "Requested range not satisfiable"},
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
 @router.get("/statement/{statement_id}")
-async def get_statement(statement_id: str) -> Response:
+async def get_statement(
+    statement_id: str, range_header: str | None = Header(default=None, alias="Range")
+) -> StreamingResponse:
     try:
-        redis_client = celery_app.backend.client
-        pdf_data = redis_client.get(f"statement:{statement_id}")
-        if not pdf_data:
+        reader = await get_statement_store().open(statement_id)
+        if reader is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -110,19 +183,39 @@ async def get_statement(statement_id: str) -> Response:
                     "message": "Statement not found or has expired",
                 },
             )
-        return Response(
-            content=pdf_data,
+
+        size = reader.size
+        headers = {
+            "Content-Disposition": f"attachment;filename=statement_{statement_id}.pdf",
+            "Accept-Ranges": "bytes",
+        }
+        try:
+            byte_range = parse_range_header(range_header, size)
+        except HTTPException:
+            await reader.close()
+            raise
+
+        if byte_range:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+        else:
+            start, end = 0, size - 1
+            status_code = status.HTTP_200_OK
+
+        headers["Content-Length"] = str(end - start + 1)
+
+        return StreamingResponse(
+            reader.iter_range(start, end),
+            status_code=status_code,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment;filename=statement_{statement_id}.pdf"
-            },
+            headers=headers,
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to retrieve statement: {e}")
-    raise HTTPException(
+        raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"status": "error", "message": "Failed to retrieve statement"},
         )
-    
\ No newline at end of file
@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.routes.auth.deps import CurrentUser, get_user_read_session
 from backend.app.api.services.transaction import get_user_transactions
-from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
 from backend.app.transaction.schema import (
     PaginatedTransactionResponseSchema,
@@ -24,9 +23,17 @@ router = APIRouter(prefix="/transactions")
 )
 async def get_transaction_history(
     current_user: CurrentUser,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_user_read_session),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from a previous page's next_cursor; skip is ignored when set",
+    ),
+    include_total: bool | None = Query(
+        default=None,
+        description="Count all matching transactions (defaults to true without a cursor)",
+    ),
     filters: TransactionFilterParamsSchema = Depends(),
 ) -> PaginatedTransactionResponseSchema:
     
@@ -44,7 +51,7 @@ async def get_transaction_history(
                 },
             )
         
-        transaction, total_count = await get_user_transactions(
+        transaction, total_count, next_cursor = await get_user_transactions(
             user_id=current_user.id,
             session=session,
             skip=skip,
@@ -55,12 +62,14 @@ async def get_transaction_history(
             transaction_category=filters.transaction_category,
             transaction_status=filters.status,
             min_amount=filters.min_amount,
-            max_amount=filters.max_amount
+            max_amount=filters.max_amount,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         transaction_responses = []
 
-        for txn in transaction:
+        for txn, counterparty_name, counterparty_account in transaction:
             metadata = txn.transaction_metadata or {}
 
             response = TransactionHistoryResponseSchema(
@@ -78,15 +87,16 @@ async def get_transaction_history(
                 converted_amount=metadata.get("converted_amount"),
                 from_currency=metadata.get("from_currency"),
                 to_currency=metadata.get("to_currency"),
-                counterparty_name=metadata.get("counterparty_name"),
-                counterparty_account=metadata.get("counterparty_account"),
+                counterparty_name=counterparty_name,
+                counterparty_account=counterparty_account,
             )
             transaction_responses.append(response)
 
         return PaginatedTransactionResponseSchema(
             total=total_count,
-            skip=skip,
+            skip=0 if cursor else skip,
             limit=limit,
+            next_cursor=next_cursor,
             transactions=transaction_responses,
         )
     except HTTPException as http_ex:
@@ -1,19 +1,16 @@
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from uuid import UUID
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from sqlmodel import select
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.routes.bank_account.deps import IdempotentRequest, idempotent
 from backend.app.api.services.transaction import complete_transfer, initiate_transfer
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
-from backend.app.core.services.transfer_alert import send_transfer_alert
 from backend.app.core.services.transfer_otp import send_transfer_otp_email
 from backend.app.core.utils.number_format import format_currency
-from backend.app.transaction.models import IdempotencyKey
+from backend.app.transaction.models import Transaction
 from backend.app.transaction.schema import (
     TransferOTPVerificationSchema,
     TransferRequestSchema,
@@ -24,20 +21,30 @@ logger = get_logger()
 router = APIRouter(prefix="/bank-account")
 
 
-def validate_uuid4(value: str) -> str:
-    try:
-        uuid_obj = UUID(value, version=4)
-        if str(uuid_obj) != value.lower():
-            raise ValueError("Not a valid UUID v4")
-        return value
-    except (ValueError, AttributeError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "status": "error",
-                "message": "Idempotency-Key must be a valid UUID v4",
-            },
-        )
+def build_initiate_transfer_response(transaction: Transaction) -> dict:
+    return TransferResponseSchema(
+        status="pending",
+        message="Transfer initiated. Please check your email for OTP verification",
+        data={
+            "reference": transaction.reference,
+            "amount": format_currency(str(transaction.amount)),
+            "converted_amount": (
+                transaction.transaction_metadata.get("converted_amount", "N/A")
+                if transaction.transaction_metadata
+                else "N/A"
+            ),
+            "from_currency": (
+                transaction.transaction_metadata.get("from_currency", "N/A")
+                if transaction.transaction_metadata
+                else "N/A"
+            ),
+            "to_currency": (
+                transaction.transaction_metadata.get("to_currency", "N/A")
+                if transaction.transaction_metadata
+                else "N/A"
+            ),
+        },
+    ).model_dump()
 
 
 @router.post(
@@ -48,40 +55,19 @@ def validate_uuid4(value: str) -> str:
 async def initiate_money_transfer(
     transfer_data: TransferRequestSchema,
     current_user: CurrentUser,
+    idempotency: Annotated[
+        IdempotentRequest,
+        Depends(idempotent("/transfer/initiate", status.HTTP_202_ACCEPTED)),
+    ],
     session: AsyncSession = Depends(get_session),
-    idempotency_key: str = Header(
-        description="Idempotency Key for the transfer request"
-    ),
 ) -> TransferResponseSchema:
     try:
-        idempotency_key = validate_uuid4(idempotency_key)
+        if idempotency.cached_response is not None:
+            return TransferResponseSchema.model_validate(idempotency.cached_response)
 
-        if not idempotency_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Idempotency-Key header is required",
-                },
-            )
+        idempotency.build_response = build_initiate_transfer_response
 
-        existing_key_result = await session.exec(
-            select(IdempotencyKey).where(
-                IdempotencyKey.key == idempotency_key,
-                IdempotencyKey.user_id == current_user.id,
-                IdempotencyKey.endpoint == "/transfer/initiate",
-                IdempotencyKey.expires_at > datetime.now(timezone.utc),
-            )
-        )
-        existing_key = existing_key_result.first()
-        if existing_key:
-            return TransferResponseSchema(
-                status="success",
-                message="Retrieved from cache",
-                data=existing_key.response_body,
-            )
-
-        transaction, sender_account, receiver_account, sender, receiver = (
+        transaction, sender_account, receiver_account, sender, receiver, otp = (
             await initiate_transfer(
                 sender_id=current_user.id,
                 sender_account_id=transfer_data.sender_account_id,
@@ -93,45 +79,13 @@ async def initiate_money_transfer(
             )
         )
         try:
-            await send_transfer_otp_email(sender.email, sender.otp)
+            await send_transfer_otp_email(sender.email, otp)
         except Exception as e:
             logger.error(f"Failed to send OTP email: {e}")
 
-        response = TransferResponseSchema(
-            status="pending",
-            message="Transfer initiated. Please check your email for OTP verification",
-            data={
-                "reference": transaction.reference,
-                "amount": format_currency(str(transaction.amount)),
-                "converted_amount": (
-                    transaction.transaction_metadata.get("converted_amount", "N/A")
-                    if transaction.transaction_metadata
-                    else "N/A"
-                ),
-                "from_currency": (
-                    transaction.transaction_metadata.get("from_currency", "N/A")
-                    if transaction.transaction_metadata
-                    else "N/A"
-                ),
-                "to_currency": (
-                    transaction.transaction_metadata.get("to_currency", "N/A")
-                    if transaction.transaction_metadata
-                    else "N/A"
-                ),
-            },
-        )
-
-        idempotency_record = IdempotencyKey(
-            key=idempotency_key,
-            user_id=current_user.id,
-            endpoint="/transfer/initiate",
-            response_code=status.HTTP_202_ACCEPTED,
-            response_body=response.model_dump(),
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
+        return TransferResponseSchema.model_validate(
+            build_initiate_transfer_response(transaction)
         )
-        session.add(idempotency_record)
-        await session.commit()
-        return response
     except HTTPException as http_ex:
         raise http_ex
     except Exception as e:
@@ -161,45 +115,6 @@ async def complete_money_transfer(
             )
         )
 
-        try:
-            await send_transfer_alert(
-                sender_email=sender.email,
-                receiver_email=receiver.email,
-                sender_name=sender.full_name,
-                receiver_name=receiver.full_name,
-                sender_account_number=sender_account.account_number or "Unknown",
-                receiver_account_number=receiver_account.account_number or "Unknown",
-                amount=transaction.amount,
-                converted_amount=(
-                    Decimal(
-                        transaction.transaction_metadata.get("converted_amount", "0")
-                    )
-                    if transaction.transaction_metadata
-                    else Decimal("0")
-                ),
-                sender_currency=sender_account.currency,
-                receiver_currency=receiver_account.currency,
-                exchange_rate=(
-                    Decimal(
-                        transaction.transaction_metadata.get("conversion_rate", "1")
-                    )
-                    if transaction.transaction_metadata
-                    else Decimal("1")
-                ),
-                conversion_fee=(
-                    Decimal(transaction.transaction_metadata.get("conversion_fee", "0"))
-                    if transaction.transaction_metadata
-                    else Decimal("0")
-                ),
-                description=transaction.description,
-                reference=transaction.reference,
-                transaction_date=transaction.completed_at or transaction.created_at,
-                sender_balance=Decimal(sender_account.balance),
-                receiver_balance=Decimal(receiver_account.balance),
-            )
-        except Exception as e:
-            logger.error(f"Failed to send transfer alerts: {e}")
-
         return TransferResponseSchema(
             status="success",
             message="Transfer completed successfully",
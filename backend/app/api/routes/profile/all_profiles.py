@@ -3,7 +3,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.routes.auth.deps import CurrentUser
 from backend.app.api.services.profile import get_all_user_profiles
-from backend.app.core.db import get_session
+from backend.app.core.db import get_read_session
 from backend.app.core.logging import get_logger
 from backend.app.user_profile.schema import (
     PaginatedProfileResponseSchema,
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/profile")
 
 async def list_user_profiles(
     current_user: CurrentUser,
-    session:AsyncSession = Depends(get_session),
+    session:AsyncSession = Depends(get_read_session),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1),
 ) -> PaginatedProfileResponseSchema:
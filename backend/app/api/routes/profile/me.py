@@ -1,9 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi import APIRouter, HTTPException, status
 
 from backend.app.api.routes.auth.deps import CurrentUser
-from backend.app.api.services.profile import get_user_with_profile
-from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
 from backend.app.user_profile.schema import ProfileResponseSchema
 
@@ -12,33 +9,19 @@ logger = get_logger()
 router = APIRouter(prefix="/profile")
 
 @router.get("/me", response_model=ProfileResponseSchema, status_code=status.HTTP_200_OK)
-async def get_my_profile(
-    current_user: CurrentUser, session: AsyncSession = Depends(get_session)
-) -> ProfileResponseSchema:
+async def get_my_profile(current_user: CurrentUser) -> ProfileResponseSchema:
     try:
-        user_with_profile = await get_user_with_profile(current_user.id, session)
-
-        if not get_user_with_profile:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "status": "error",
-                    "message": "User not found",
-                    "action": "Please try again or contact support",
-                },
-            )
-        
         response = ProfileResponseSchema(
-            username=user_with_profile.username or "",
-            first_name=user_with_profile.first_name or "",
-            middle_name=user_with_profile.middle_name or "",
-            last_name=user_with_profile.last_name or "",
-            email=user_with_profile.email or "",
-            id_no=str(user_with_profile.id_no) if user_with_profile.id_no else "",
-            role = user_with_profile.role,
-            profile=user_with_profile.profile,
+            username=current_user.username or "",
+            first_name=current_user.first_name or "",
+            middle_name=current_user.middle_name or "",
+            last_name=current_user.last_name or "",
+            email=current_user.email or "",
+            id_no=str(current_user.id_no) if current_user.id_no else "",
+            role = current_user.role,
+            profile=current_user.profile,
         )
-        logger.debug(f"Successfully fetched profile for user {user_with_profile.id}")
+        logger.debug(f"Successfully fetched profile for user {current_user.id}")
         return response
     except HTTPException as http_ex:
         raise http_ex
@@ -12,6 +12,12 @@ from backend.app.bank_account.schema import BankAccountCreateSchema
 from backend.app.bank_account.utils import generate_account_number
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.services.bank_account_activated_email import (
+    send_account_activated_email,
+)
+from backend.app.core.services.bank_account_created_email import (
+    send_account_created_email,
+)
 
 logger = get_logger()
 
@@ -93,6 +99,20 @@ async def create_bank_account(
 
         session.add(new_account)
 
+        try:
+            send_account_created_email(
+                email=user.email,
+                full_name=user.full_name,
+                account_number=account_number,
+                account_name=new_account.account_name,
+                account_type=new_account.account_type.value,
+                currency=new_account.currency.value,
+                identification_type=user.profile.means_of_identification.value,
+                session=session,
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue account creation email: {e}")
+
         await session.commit()
         await session.refresh(new_account)
 
@@ -148,6 +168,20 @@ async def activate_bank_account(
         account.account_status = AccountStatusEnum.Active
 
         session.add(account)
+
+        try:
+            send_account_activated_email(
+                email=user.email,
+                full_name=user.full_name,
+                account_number=account.account_number or "Unknown",
+                account_name=account.account_name,
+                account_type=account.account_type.value,
+                currency=account.currency.value,
+                session=session,
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue bank account activated email: {e}")
+
         await session.commit()
         await session.refresh(account)
 
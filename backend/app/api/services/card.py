@@ -22,7 +22,6 @@ from backend.app.virtual_card.enums import VirtualCardStatusEnum
 from backend.app.virtual_card.models import VirtualCard
 from backend.app.virtual_card.utils import (
     generate_card_expiry_date,
-    generate_cvv,
     generate_visa_card_number,
 )   
 
@@ -89,8 +88,8 @@ async def created_virtual_card(
             bank_account_id=bank_account_id,
             card_status=VirtualCardStatusEnum.Pending,
             is_active=True,
-            available_balance=0.0,
-            total_topped_up=0.0,
+            available_balance=Decimal("0.00"),
+            total_topped_up=Decimal("0.00"),
             last_top_up_date=datetime.now(timezone.utc),
             card_metadata={
                 "created_by": str(user.id),
@@ -183,7 +182,7 @@ async def block_virtual_card(
 async def top_up_virtual_card(
     card_id: UUID,
     account_number: str,
-    amount: float,
+    amount: Decimal,
     description: str,
     session: AsyncSession,
 ) -> tuple[VirtualCard, Transaction]:
@@ -215,7 +214,7 @@ async def top_up_virtual_card(
                 detail={"satus": "error", "message": "card is not active"},
             )
         
-        if Decimal(str(bank_account.balance)) < Decimal(str(amount)):
+        if bank_account.balance < amount:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -235,13 +234,13 @@ async def top_up_virtual_card(
         
         reference = f"TOPUP{uuid.uuid4().hex[:8].upper()}"
 
-        balance_before = Decimal(str(bank_account.balance))
-        balance_after = balance_before = Decimal(str(amount))
+        balance_before = bank_account.balance
+        balance_after = balance_before - amount
 
         current_time = datetime.now(timezone.utc)
 
         transaction = Transaction(
-            amount=Decimal(str(amount)),
+            amount=amount,
             description=description,
             reference=reference,
             transaction_type=TransactionTypeEnum.Transfer,
@@ -259,7 +258,7 @@ async def top_up_virtual_card(
             },
         )
         
-        bank_account.balance = float(balance_after)
+        bank_account.balance = balance_after
         card.available_balance += amount
         card.total_topped_up += amount
 
@@ -6,6 +6,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.auth.models import User
 from backend.app.core.logging import get_logger
+from backend.app.core.user_cache import invalidate_cached_user
 from backend.app.user_profile.models import Profile
 from backend.app.user_profile.schema import ProfileCreateSchema,ProfileUpdateSchema ,RoleChoicesSchema
 from backend.app.user_profile.enums import ImageTypeEnum
@@ -50,6 +51,8 @@ async def create_user_profile(
             await session.commit()
             await session.refresh(profile)
 
+            await invalidate_cached_user(user_id)
+
             logger.info(f"Created profile for user {user_id}")
             return profile
         
@@ -89,6 +92,8 @@ async def update_user_profile(
           await session.commit()
           await session.refresh(profile)
 
+          await invalidate_cached_user(user_id)
+
           logger.info(f"Updated profile for user {user_id}")
           return profile
      
@@ -153,6 +158,8 @@ async def update_profile_image_url(
 
           await session.refresh(profile)
 
+          await invalidate_cached_user(user_id)
+
           return profile
      except HTTPException as http_ex:
           raise http_ex
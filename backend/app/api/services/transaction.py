@@ -1,22 +1,41 @@
+import csv
+import io
+import json
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlmodel import any_, desc, func, or_, select
+from sqlalchemy import case, tuple_
+from sqlalchemy.orm import aliased
+from sqlmodel import any_, col, desc, func, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.auth.models import User
-from backend.app.auth.utils import generate_otp
 from backend.app.bank_account.enums import AccountStatusEnum
 from backend.app.bank_account.models import BankAccount
 from backend.app.bank_account.utils import calculate_conversion
 from backend.app.core.config import settings
+from backend.app.core.db import read_session_scope
 from backend.app.core.logging import get_logger
+from backend.app.core.otp_store import OTPCheckEnum, OTPPurposeEnum, get_otp_store
+from backend.app.core.services.deposit_alert import send_deposit_alert
 from backend.app.core.services.transfer_alert import send_transfer_alert
-from backend.app.core.tasks.statement import generate_statement_pdf
+from backend.app.core.services.withdrawl_alert import send_withdrwal_alert
+from backend.app.core.statement_store import (
+    cache_statement,
+    discard_cached_statement,
+    get_cached_statement,
+    statement_cache_key,
+)
+from backend.app.core.tasks.statement import (
+    generate_statement_pdf,
+    stream_statement_pdf,
+)
 from backend.app.transaction.enums import (
+    StatementFormatEnum,
     TransactionCategoryEnum,
     TransactionStatusEnum,
     TransactionTypeEnum,
@@ -24,11 +43,82 @@ from backend.app.transaction.enums import (
 from backend.app.transaction.models import Transaction
 from backend.app.transaction.utils import (
     TransactionFailureReason,
+    build_statement_transaction_row,
+    build_statement_transactions_query,
+    build_statement_user_data,
+    decode_history_cursor,
+    encode_history_cursor,
     mark_transaction_failed,
 )
 
 logger = get_logger()
 
+STATEMENT_EXPORT_FIELDS = [
+    "reference",
+    "created_at",
+    "transaction_type",
+    "transaction_category",
+    "amount",
+    "balance_after",
+    "description",
+    "sender_account",
+    "receiver_account",
+]
+
+
+async def lock_transfer_accounts(
+    sender_account_id: uuid.UUID | None,
+    receiver_account_id: uuid.UUID | None,
+    session: AsyncSession,
+) -> tuple[BankAccount | None, BankAccount | None]:
+    result = await session.exec(
+        select(BankAccount)
+        .where(col(BankAccount.id).in_([sender_account_id, receiver_account_id]))
+        .order_by(BankAccount.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    accounts = {account.id: account for account in result.all()}
+    return accounts.get(sender_account_id), accounts.get(receiver_account_id)
+
+
+def queue_transfer_alerts(
+    *,
+    transaction: Transaction,
+    sender: User,
+    receiver: User,
+    sender_account: BankAccount,
+    receiver_account: BankAccount,
+    converted_amount: Decimal,
+    session: AsyncSession,
+) -> None:
+    metadata = transaction.transaction_metadata or {}
+    try:
+        send_transfer_alert(
+            sender_email=sender.email,
+            receiver_email=receiver.email,
+            sender_name=sender.full_name,
+            receiver_name=receiver.full_name,
+            sender_account_number=sender_account.account_number or "Unknown",
+            receiver_account_number=receiver_account.account_number or "Unknown",
+            amount=transaction.amount,
+            converted_amount=converted_amount,
+            sender_currency=sender_account.currency,
+            receiver_currency=receiver_account.currency,
+            exchange_rate=Decimal(metadata.get("conversion_rate", "1")),
+            conversion_fee=Decimal(metadata.get("conversion_fee", "0")),
+            description=transaction.description,
+            reference=transaction.reference,
+            transaction_date=transaction.completed_at or transaction.created_at,
+            sender_balance=sender_account.balance,
+            receiver_balance=receiver_account.balance,
+            session=session,
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to queue transfer alerts for {transaction.reference}: {e}"
+        )
+
 
 async def process_deposit(
     *,
@@ -60,7 +150,7 @@ async def process_deposit(
             )
         reference = f"DEP{uuid.uuid4().hex[:8].upper()}"
 
-        balance_before = Decimal(str(account.balance))
+        balance_before = account.balance
         balance_after = balance_before + amount
 
         transaction = Transaction(
@@ -89,13 +179,32 @@ async def process_deposit(
 
             transaction.transaction_metadata["teller_email"] = teller.email
 
-        account.balance = float(balance_after)
+        account.balance = balance_after
 
         transaction.status = TransactionStatusEnum.Completed
         transaction.completed_at = datetime.now(timezone.utc)
 
         session.add(transaction)
         session.add(account)
+
+        try:
+            send_deposit_alert(
+                email=account_owner.email,
+                full_name=account_owner.full_name,
+                action=TransactionTypeEnum.Deposit.value,
+                amount=transaction.amount,
+                account_name=account.account_name,
+                account_number=account.account_number or "Unknown",
+                currency=account.currency.value,
+                description=transaction.description,
+                transaction_date=transaction.completed_at,
+                reference=transaction.reference,
+                balance=transaction.balance_after,
+                session=session,
+            )
+        except Exception as email_error:
+            logger.error(f"Failed to queue deposit alert: {email_error}")
+
         await session.commit()
 
         await session.refresh(transaction)
@@ -124,18 +233,26 @@ async def initiate_transfer(
     description: str,
     security_answer: str,
     session: AsyncSession,
-) -> tuple[Transaction, BankAccount, BankAccount, User, User]:
+) -> tuple[Transaction, BankAccount, BankAccount, User, User, str]:
 
     try:
-        reciever_account_result = await session.exec(
-            select(BankAccount).where(
-                BankAccount.account_number == receiver_account_number,
-                BankAccount.user_id == sender_id,
-            )
+        receiver_stmt = (
+            select(BankAccount, User)
+            .join(User)
+            .where(BankAccount.account_number == receiver_account_number)
         )
-        receiver_account = reciever_account_result.first()
+        receiver_result = await session.exec(receiver_stmt)
+        receiver_data = receiver_result.first()
+
+        if not receiver_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"status": "error", "message": "Receiver account not found"},
+            )
 
-        if receiver_account:
+        receiver_account, receiver = receiver_data
+
+        if receiver_account.user_id == sender_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -176,29 +293,13 @@ async def initiate_transfer(
                 detail={"status": "error", "message": "Incorrect security answer"},
             )
 
-        receiver_stmt = (
-            select(BankAccount, User)
-            .join(User)
-            .where(BankAccount.account_number == receiver_account_number)
-        )
-        receiver_result = await session.exec(receiver_stmt)
-        receiver_data = receiver_result.first()
-
-        if not receiver_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"status": "error", "message": "Receiver account not found"},
-            )
-
-        receiver_account, receiver = receiver_data
-
         if receiver_account.account_status != AccountStatusEnum.Active:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"status": "error", "message": "Receiver account is not active"},
             )
 
-        if Decimal(str(sender_account.balance)) < amount:
+        if sender_account.balance < amount:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"status": "error", "message": "Insuffienct balance"},
@@ -232,8 +333,8 @@ async def initiate_transfer(
             transaction_type=TransactionTypeEnum.Transfer,
             transaction_category=TransactionCategoryEnum.Debit,
             status=TransactionStatusEnum.Pending,
-            balance_before=Decimal(str(sender_account.balance)),
-            balance_after=Decimal(str(sender_account.balance)) - amount,
+            balance_before=sender_account.balance,
+            balance_after=sender_account.balance - amount,
             sender_account_id=sender_account.id,
             receiver_account_id=receiver_account.id,
             sender_id=sender.id,
@@ -247,23 +348,16 @@ async def initiate_transfer(
                 "to_currency": receiver_account.currency.value,
             },
         )
-        session.add(transaction)
-        await session.commit()
-        await session.refresh(transaction)
-
-        otp = generate_otp()
-
-        sender.otp = otp
-        sender.otp_expiry_time = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.OTP_EXPIRATION_MINUTES
+        otp = await get_otp_store().issue(
+            sender.id,
+            OTPPurposeEnum.TRANSFER,
+            settings.OTP_EXPIRATION_MINUTES * 60,
         )
 
         session.add(transaction)
-        session.add(sender)
         await session.commit()
-        await session.refresh(transaction)
 
-        return transaction, sender_account, receiver_account, sender, receiver
+        return transaction, sender_account, receiver_account, sender, receiver, otp
     except HTTPException:
         await session.rollback()
         raise
@@ -279,73 +373,65 @@ async def initiate_transfer(
 async def complete_transfer(
     *, reference: str, otp: str, session: AsyncSession
 ) -> tuple[Transaction, BankAccount, BankAccount, User, User]:
+    transaction = None
     try:
-        stmt = select(Transaction).where(
+        pending_transfer = (
             Transaction.reference == reference,
             Transaction.status == TransactionStatusEnum.Pending,
         )
-        result = await session.exec(stmt)
-        transaction = result.first()
+        result = await session.exec(
+            select(Transaction.sender_id).where(*pending_transfer)
+        )
+        sender_id = result.first()
 
-        if not transaction:
+        if not sender_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"status": "error", "message": "Transfer not found"},
             )
 
-        sender_account = await session.get(BankAccount, transaction.sender_account_id)
-        receiver_account = await session.get(
-            BankAccount, transaction.receiver_account_id
+        otp_check = await get_otp_store().verify(
+            sender_id,
+            OTPPurposeEnum.TRANSFER,
+            otp,
+            settings.OTP_MAX_ATTEMPTS,
         )
-        sender = await session.get(User, transaction.sender_id)
-        receiver = await session.get(User, transaction.receiver_id)
 
-        if not all([sender_account, receiver_account, sender, receiver]):
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReason.INVALID_ACCOUNT,
-                details={
-                    "sender_account_found": bool(sender_account),
-                    "receiver_account_found": bool(receiver_account),
-                    "sender_found": bool(sender),
-                    "receiver_found": bool(receiver),
-                },
-                session=session,
-                error_message="Account information not found",
+        if otp_check == OTPCheckEnum.INVALID:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={"status": "error", "message": "Invalid OTP"},
             )
+
+        result = await session.exec(
+            select(Transaction).where(*pending_transfer).with_for_update()
+        )
+        transaction = result.first()
+
+        if not transaction:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail={"status": "error", "message": "Account information not found"},
+                detail={"status": "error", "message": "Transfer not found"},
             )
 
-        if not sender or not sender.otp or sender.otp != otp:
+        if otp_check == OTPCheckEnum.EXHAUSTED:
             await mark_transaction_failed(
                 transaction=transaction,
                 reason=TransactionFailureReason.INVALID_OTP,
-                details={"provided_otp": otp},
+                details={"max_attempts": settings.OTP_MAX_ATTEMPTS},
                 session=session,
-                error_message="Invalid OTP",
+                error_message="Too many invalid OTP attempts",
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={"status": "error", "message": "Invalid OTP"},
             )
 
-        if (
-            not sender.otp_expiry_time
-            or datetime.now(timezone.utc) > sender.otp_expiry_time
-        ):
+        if otp_check == OTPCheckEnum.EXPIRED:
             await mark_transaction_failed(
                 transaction=transaction,
                 reason=TransactionFailureReason.OTP_EXPIRED,
-                details={
-                    "expiry_time": (
-                        sender.otp_expiry_time.isoformat()
-                        if sender.otp_expiry_time
-                        else None
-                    ),
-                    "current_time": datetime.now(timezone.utc).isoformat(),
-                },
+                details={"current_time": datetime.now(timezone.utc).isoformat()},
                 session=session,
                 error_message="OTP has expired",
             )
@@ -354,6 +440,30 @@ async def complete_transfer(
                 detail={"status": "error", "message": "OTP has expired"},
             )
 
+        sender_account, receiver_account = await lock_transfer_accounts(
+            transaction.sender_account_id, transaction.receiver_account_id, session
+        )
+        sender = await session.get(User, transaction.sender_id)
+        receiver = await session.get(User, transaction.receiver_id)
+
+        if not all([sender_account, receiver_account, sender, receiver]):
+            await mark_transaction_failed(
+                transaction=transaction,
+                reason=TransactionFailureReason.INVALID_ACCOUNT,
+                details={
+                    "sender_account_found": bool(sender_account),
+                    "receiver_account_found": bool(receiver_account),
+                    "sender_found": bool(sender),
+                    "receiver_found": bool(receiver),
+                },
+                session=session,
+                error_message="Account information not found",
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"status": "error", "message": "Account information not found"},
+            )
+
         if sender_account and sender_account.account_status != AccountStatusEnum.Active:
             await mark_transaction_failed(
                 transaction=transaction,
@@ -394,16 +504,14 @@ async def complete_transfer(
                 detail={"status": "error", "message": "Sendwer account not found"},
             )
 
-        if Decimal(str(sender_account.balance)) < transaction.amount:
+        if sender_account.balance < transaction.amount:
             await mark_transaction_failed(
                 transaction=transaction,
                 reason=TransactionFailureReason.INSUFFICIENT_BALANCE,
                 details={
                     "required_amount": str(transaction.amount),
                     "available_balance": str(sender_account.balance),
-                    "shortfall": str(
-                        transaction.amount - Decimal(str(sender_account.balance))
-                    ),
+                    "shortfall": str(transaction.amount - sender_account.balance),
                 },
                 session=session,
                 error_message="Insufficient balance",
@@ -434,9 +542,12 @@ async def complete_transfer(
 
         converted_amount = Decimal(transaction.transaction_metadata["converted_amount"])
 
-        sender_account.balance = float(
-            Decimal(str(sender_account.balance)) - transaction.amount
-        )
+        sender_balance = sender_account.balance
+
+        transaction.balance_before = sender_balance
+        transaction.balance_after = sender_balance - transaction.amount
+
+        sender_account.balance = transaction.balance_after
 
         if not receiver_account:
             raise HTTPException(
@@ -444,20 +555,25 @@ async def complete_transfer(
                 detail={"status": "error", "message": "Receiver account not found"},
             )
 
-        receiver_account.balance = float(
-            Decimal(str(receiver_account.balance)) + converted_amount
-        )
+        receiver_account.balance += converted_amount
 
         transaction.status = TransactionStatusEnum.Completed
         transaction.completed_at = datetime.now(timezone.utc)
 
-        sender.otp = ""
-        sender.otp_expiry_time = None
-
         session.add(transaction)
         session.add(sender_account)
         session.add(receiver_account)
-        session.add(sender)
+
+        queue_transfer_alerts(
+            transaction=transaction,
+            sender=sender,
+            receiver=receiver,
+            sender_account=sender_account,
+            receiver_account=receiver_account,
+            converted_amount=converted_amount,
+            session=session,
+        )
+
         await session.commit()
 
         await session.refresh(transaction)
@@ -527,7 +643,7 @@ async def process_withdrawal(
                 detail={"status": "error", "message": "Account is not active"},
             )
 
-        if Decimal(str(account.balance)) < amount:
+        if account.balance < amount:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"status": "error", "message": "Insufficient balance"},
@@ -535,7 +651,7 @@ async def process_withdrawal(
 
         reference = f"WTH{uuid.uuid4().hex[:8].upper()}"
 
-        balance_before = Decimal(str(account.balance))
+        balance_before = account.balance
         balance_after = balance_before - amount
 
         transaction = Transaction(
@@ -557,18 +673,31 @@ async def process_withdrawal(
             },
         )
 
-        session.add(transaction)
-        await session.commit()
-        await session.refresh(transaction)
+        account.balance = balance_after
 
-        transaction.status = TransactionStatusEnum.Completed
-        transaction.completed_at = datetime.now(timezone.utc)
+        session.add(transaction)
+        session.add(account)
 
-        account.balance = float(balance_after)
+        try:
+            send_withdrwal_alert(
+                email=user.email,
+                full_name=user.full_name,
+                amount=transaction.amount,
+                account_name=account.account_name,
+                account_number=account.account_number or "Unknown",
+                currency=account.currency.value,
+                description=transaction.description,
+                transaction_date=transaction.completed_at or transaction.created_at,
+                reference=transaction.reference,
+                balance=account.balance,
+                session=session,
+            )
+        except Exception as email_error:
+            logger.error(f"Failed to queue withdrawal alert: {email_error}")
 
-        session.add(account)
         await session.commit()
 
+        await session.refresh(transaction)
         await session.refresh(account)
 
         return transaction, account, user
@@ -596,14 +725,18 @@ async def get_user_transactions(
     transaction_status: TransactionStatusEnum | None = None,
     min_amount: Decimal | None = None,
     max_amount: Decimal | None = None,
-) -> tuple[list[Transaction], int]:
+    cursor: str | None = None,
+    include_total: bool | None = None,
+) -> tuple[list[tuple[Transaction, str | None, str | None]], int | None, str | None]:
     try:
+        if include_total is None:
+            include_total = cursor is None
         account_stmt = select(BankAccount.id).where(BankAccount.user_id == user_id)
         result = await session.exec(account_stmt)
         account_ids = [account_id for account_id in result.all()]
 
         if not account_ids:
-            return [], 0
+            return [], 0 if include_total else None, None
 
         base_query = select(Transaction).where(
             or_(
@@ -636,46 +769,77 @@ async def get_user_transactions(
         if max_amount is not None:
             base_query = base_query.where(Transaction.amount <= max_amount)
 
-        base_query = base_query.order_by(desc(Transaction.created_at))
+        total_count = None
+        if include_total:
+            count_query = select(func.count()).select_from(base_query.subquery())
+            total = await session.exec(count_query)
+            total_count = total.first() or 0
+
+        is_outgoing = Transaction.sender_id == user_id
+        counterparty = aliased(User)
+        counterparty_account = aliased(BankAccount)
+
+        page_query = (
+            select(
+                Transaction,
+                counterparty.first_name,
+                counterparty.middle_name,
+                counterparty.last_name,
+                counterparty_account.account_number,
+            )
+            .where(base_query.whereclause)
+            .outerjoin(
+                counterparty,
+                counterparty.id
+                == case(
+                    (is_outgoing, Transaction.receiver_id),
+                    else_=Transaction.sender_id,
+                ),
+            )
+            .outerjoin(
+                counterparty_account,
+                counterparty_account.id
+                == case(
+                    (is_outgoing, Transaction.receiver_account_id),
+                    else_=Transaction.sender_account_id,
+                ),
+            )
+            .order_by(desc(Transaction.created_at), desc(Transaction.id))
+            .limit(limit + 1)
+        )
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total = await session.exec(count_query)
-        total_count = total.first() or 0
+        if cursor:
+            cursor_created_at, cursor_id = decode_history_cursor(cursor)
+            page_query = page_query.where(
+                tuple_(Transaction.created_at, Transaction.id)
+                < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            page_query = page_query.offset(skip)
 
-        transactions = await session.exec(base_query.offset(skip).limit(limit))
+        rows = list((await session.exec(page_query)).all())
 
-        transaction_list = list(transactions.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = encode_history_cursor(last.created_at, last.id)
 
-        for transaction in transaction_list:
-            await session.refresh(
-                transaction,
-                ["sender", "receiver", "sender_account", "receiver_account"],
+        transaction_list = []
+        for transaction, first_name, middle_name, last_name, account_number in rows:
+            counterparty_name = (
+                f"{first_name} {middle_name + ' ' if middle_name else ''}{last_name}".title().strip()
+                if first_name
+                else None
             )
+            transaction_list.append((transaction, counterparty_name, account_number))
 
-            if not transaction.transaction_metadata:
-                transaction.transaction_metadata = {}
-
-            if transaction.sender_id == user_id:
-                if transaction.receiver:
-                    transaction.transaction_metadata["counterparty_name"] = (
-                        transaction.receiver.full_name
-                    )
-
-                if transaction.receiver_account:
-                    transaction.transaction_metadata["counterparty_account"] = (
-                        transaction.receiver_account.account_number
-                    )
-            else:
-                if transaction.sender:
-                    transaction.transaction_metadata["counterparty_name"] = (
-                        transaction.sender.full_name
-                    )
-                if transaction.sender_account:
-                    transaction.transaction_metadata["counterparty_account"] = (
-                        transaction.sender_account.account_number
-                    )
-
-        return transaction_list, total_count
+        return transaction_list, total_count, next_cursor
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "message": str(e)},
+        )
     except Exception as e:
         logger.error(f"Error fetching user transactions: {e}")
         raise HTTPException(
@@ -764,78 +928,18 @@ async def prepare_statement_data(
             accounts_result = await session.exec(accounts_query)
             accounts = accounts_result.all()
 
-        account_details = []
-
-        for acc in accounts:
-            if acc.account_number:
-                account_details.append(
-                    {
-                        "account_number": acc.account_number,
-                        "account_name": acc.account_name,
-                        "account_type": acc.account_type.value,
-                        "currency": acc.currency.value,
-                        "balance": str(acc.balance),
-                    }
-                )
         account_ids = [acc.id for acc in accounts]
 
-        transactions_query = (
-            select(Transaction)
-            .where(
-                or_(
-                    Transaction.sender_account_id == any_(account_ids),
-                    Transaction.receiver_account_id == any_(account_ids),
-                ),
-                Transaction.created_at >= start_date,
-                Transaction.created_at <= end_date,
-                Transaction.status == TransactionStatusEnum.Completed,
-            )
-            .order_by(desc(Transaction.created_at))
+        result = await session.exec(
+            build_statement_transactions_query(account_ids, start_date, end_date)
         )
 
-        result = await session.exec(transactions_query)
-        transactions = result.all()
-
-        user_data = {
-            "username": user.username,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": f"{user.first_name} {user.middle_name + ' ' if user.middle_name else ''}{user.last_name}".strip(),
-            "accounts": account_details,
-        }
-
-        transaction_data = []
-        for txn in transactions:
-            sender_account = (
-                await session.get(BankAccount, txn.sender_account_id)
-                if txn.sender_account_id
-                else None
-            )
-            receiver_account = (
-                await session.get(BankAccount, txn.receiver_account_id)
-                if txn.receiver_account_id
-                else None
-            )
+        user_data = build_statement_user_data(user, accounts)
 
-            transaction_data.append(
-                {
-                    "reference": txn.reference,
-                    "amount": str(txn.amount),
-                    "description": txn.description,
-                    "created_at": txn.created_at.strftime("%Y-%m-%d"),
-                    "transaction_type": txn.transaction_type.value,
-                    "transaction_category": txn.transaction_category.value,
-                    "balance_after": str(txn.balance_after),
-                    "sender_account": (
-                        sender_account.account_number if sender_account else None
-                    ),
-                    "receiver_account": (
-                        receiver_account.account_number if receiver_account else None
-                    ),
-                    "metadata": txn.transaction_metadata,
-                }
-            )
+        transaction_data = [
+            build_statement_transaction_row(txn, sender_account, receiver_account)
+            for txn, sender_account, receiver_account in result.all()
+        ]
         return {
             "user": user_data,
             "transactions": transaction_data,
@@ -857,10 +961,8 @@ async def _complete_approved_transfer(transaction: Transaction, session: AsyncSe
 
         receiver = await session.get(User, transaction.receiver_id)
 
-        sender_account = await session.get(BankAccount, transaction.sender_account_id)
-
-        receiver_account = await session.get(
-            BankAccount, transaction.receiver_account_id
+        sender_account, receiver_account = await lock_transfer_accounts(
+            transaction.sender_account_id, transaction.receiver_account_id, session
         )
 
         if not sender:
@@ -885,17 +987,18 @@ async def _complete_approved_transfer(transaction: Transaction, session: AsyncSe
         except (TypeError, ValueError):
             raise ValueError(f"Invalid converted amount format:{converted_amount_str}")
 
-        current_sender_balance = Decimal(str(sender_account.balance))
+        current_sender_balance = sender_account.balance
 
         if current_sender_balance < transaction.amount:
             raise ValueError("Insufficient balance for transfer")
 
         try:
-            sender_account.balance = float(current_sender_balance - transaction.amount)
+            transaction.balance_before = current_sender_balance
+            transaction.balance_after = current_sender_balance - transaction.amount
 
-            receiver_account.balance = float(
-                Decimal(str(receiver_account.balance)) + converted_amount
-            )
+            sender_account.balance = transaction.balance_after
+
+            receiver_account.balance += converted_amount
 
             transaction.status = TransactionStatusEnum.Completed
             transaction.completed_at = datetime.now(timezone.utc)
@@ -904,42 +1007,21 @@ async def _complete_approved_transfer(transaction: Transaction, session: AsyncSe
             session.add(receiver_account)
             session.add(transaction)
 
+            queue_transfer_alerts(
+                transaction=transaction,
+                sender=sender,
+                receiver=receiver,
+                sender_account=sender_account,
+                receiver_account=receiver_account,
+                converted_amount=converted_amount,
+                session=session,
+            )
+
             await session.commit()
 
             await session.refresh(transaction)
             await session.refresh(sender_account)
             await session.refresh(receiver_account)
-
-            try:
-                await send_transfer_alert(
-                    sender_email=sender.email,
-                    receiver_email=receiver.email,
-                    sender_name=sender.full_name,
-                    receiver_name=receiver.full_name,
-                    sender_account_number=sender_account.account_number or "Uknown",
-                    receiver_account_number=receiver_account.account_number
-                    or "Unknown",
-                    amount=transaction.amount,
-                    converted_amount=converted_amount,
-                    sender_currency=sender_account.currency,
-                    receiver_currency=receiver_account.currency,
-                    exchange_rate=Decimal(
-                        transaction.transaction_metadata.get("conversion_rate", "1"),
-                    ),
-                    conversion_fee=Decimal(
-                        transaction.transaction_metadata.get("conversion_fee", "0"),
-                    ),
-                    description=transaction.description,
-                    reference=transaction.reference,
-                    transaction_date=transaction.completed_at or transaction.created_at,
-                    sender_balance=Decimal(str(sender_account.balance)),
-                    receiver_balance=Decimal(str(receiver_account.balance)),
-                )
-                logger.info(
-                    f"Successfully sent transfer approval notificatoin for transaction {transaction.reference}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to send transfer approval notification: {e}")
         except Exception as e:
             await session.rollback()
             raise ValueError(f"Failed to process transfer: {str(e)}")
@@ -962,6 +1044,95 @@ async def _complete_approved_transfer(transaction: Transaction, session: AsyncSe
         logger.error(f"Unexpected error in _complete_approved_transfer: {e}")
         raise
 
+async def get_statement_account_ids(
+    user_id: uuid.UUID,
+    session: AsyncSession,
+    account_number: str | None = None,
+) -> list[uuid.UUID]:
+    accounts_query = select(BankAccount.id).where(BankAccount.user_id == user_id)
+    if account_number:
+        accounts_query = accounts_query.where(
+            BankAccount.account_number == account_number
+        )
+    result = await session.exec(accounts_query)
+    account_ids = list(result.all())
+
+    if not account_ids:
+        raise ValueError("Account not found or does not belong to user")
+    return account_ids
+
+
+async def get_statement_window_stats(
+    user_id: uuid.UUID,
+    start_date: datetime,
+    end_date: datetime,
+    session: AsyncSession,
+    account_number: str | None = None,
+) -> tuple[int, datetime | None]:
+    account_ids = await get_statement_account_ids(user_id, session, account_number)
+
+    window = (
+        build_statement_transactions_query(account_ids, start_date, end_date)
+        .order_by(None)
+        .subquery()
+    )
+    result = await session.exec(
+        select(func.count(), func.max(window.c.completed_at))
+    )
+    transaction_count, latest_completed_at = result.one()
+    return transaction_count, latest_completed_at
+
+
+async def export_statement_rows(
+    user_id: uuid.UUID,
+    start_date: datetime,
+    end_date: datetime,
+    statement_format: StatementFormatEnum,
+    account_number: str | None = None,
+) -> AsyncIterator[str]:
+    async with read_session_scope(user_id) as session:
+        account_ids = await get_statement_account_ids(
+            user_id, session, account_number
+        )
+        result = await session.stream(
+            build_statement_transactions_query(
+                account_ids, start_date, end_date
+            ).execution_options(yield_per=settings.STATEMENT_STREAM_CHUNK_SIZE)
+        )
+
+        if statement_format == StatementFormatEnum.CSV:
+            buffer = io.StringIO()
+            writer = csv.DictWriter(
+                buffer, fieldnames=STATEMENT_EXPORT_FIELDS, extrasaction="ignore"
+            )
+            writer.writeheader()
+            yield buffer.getvalue()
+
+        async for partition in result.partitions():
+            buffer = io.StringIO()
+            rows = (
+                {
+                    **build_statement_transaction_row(
+                        txn, sender_account, receiver_account
+                    ),
+                    "created_at": txn.created_at.isoformat(),
+                }
+                for txn, sender_account, receiver_account in partition
+            )
+
+            if statement_format == StatementFormatEnum.CSV:
+                writer = csv.DictWriter(
+                    buffer, fieldnames=STATEMENT_EXPORT_FIELDS, extrasaction="ignore"
+                )
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(row, default=str))
+                    buffer.write("\n")
+
+            yield buffer.getvalue()
+
+
 async def generate_user_statement(
         user_id: uuid.UUID,
         start_date: datetime,
@@ -970,25 +1141,92 @@ async def generate_user_statement(
         account_number: str | None = None,
 ) -> dict:
     try:
-        statement_data = await prepare_statement_data(
-            user_id = user_id,
-            start_date = start_date,
-            end_date = end_date,
-            session = session,
+        transaction_count, latest_completed_at = await get_statement_window_stats(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            session=session,
             account_number=account_number,
         )
 
-        statement_id = str(uuid.uuid4())
+        cache_key = statement_cache_key(
+            user_id,
+            account_number,
+            start_date.isoformat(),
+            end_date.isoformat(),
+            StatementFormatEnum.PDF.value,
+            transaction_count,
+            latest_completed_at.isoformat() if latest_completed_at else None,
+        )
+
+        cached = await get_cached_statement(cache_key)
+        if cached:
+            logger.info(f"Reusing statement {cached['statement_id']} for user {user_id}")
+            return {
+                "status": "cached",
+                "message": "Statement already generated for this period",
+                **cached,
+            }
 
-        task = generate_statement_pdf.delay(
-            statement_data = statement_data, statement_id=statement_id
+        statement_id = str(uuid.uuid4())
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.STATEMENT_TTL_SECONDS
         )
+        statement = {
+            "statement_id": statement_id,
+            "task_id": str(uuid.uuid4()),
+            "expires_at": expires_at.isoformat(),
+        }
+
+        if not await cache_statement(
+            cache_key, statement, settings.STATEMENT_TTL_SECONDS
+        ):
+            cached = await get_cached_statement(cache_key)
+            if cached:
+                return {
+                    "status": "cached",
+                    "message": "Statement already generated for this period",
+                    **cached,
+                }
+
+        try:
+            if transaction_count >= settings.STATEMENT_STREAMING_THRESHOLD:
+                stream_statement_pdf.apply_async(
+                    kwargs={
+                        "user_id": str(user_id),
+                        "start_date": start_date.isoformat(),
+                        "end_date": end_date.isoformat(),
+                        "statement_id": statement_id,
+                        "account_number": account_number,
+                        "cache_key": cache_key,
+                    },
+                    task_id=statement["task_id"],
+                )
+            else:
+                statement_data = await prepare_statement_data(
+                    user_id = user_id,
+                    start_date = start_date,
+                    end_date = end_date,
+                    session = session,
+                    account_number=account_number,
+                )
+
+                generate_statement_pdf.apply_async(
+                    kwargs={
+                        "statement_data": statement_data,
+                        "statement_id": statement_id,
+                        "cache_key": cache_key,
+                    },
+                    task_id=statement["task_id"],
+                )
+        except Exception:
+            await discard_cached_statement(cache_key)
+            raise
 
         return {
             "status": "pending",
             "message" : "Statement generation initiated",
-            "statement_id": statement_id,
-            "task_id": task.id
+            **statement,
         }
     
     except ValueError as e:
@@ -999,5 +1237,3 @@ async def generate_user_statement(
     except Exception as e:
         logger.error(f"failed to initiate statement generation: {e}")
         raise
-
-    
\ No newline at end of file
@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -11,16 +10,17 @@ from backend.app.auth.models import User
 from backend.app.auth.schema import AccountStatusSchema, UserCreateSchema
 from backend.app.auth.utils import (
     create_activation_token,
-    generate_otp,
-    generate_password_hash,
+    generate_password_hash_async,
     generate_username,
-    verify_password,
+    verify_password_async,
 )
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.otp_store import OTPCheckEnum, OTPPurposeEnum, get_otp_store
 from backend.app.core.services.account_lockout import send_account_lockout_email
 from backend.app.core.services.activation_email import send_activation_email
 from backend.app.core.services.login_otp import send_login_otp_email
+from backend.app.core.user_cache import invalidate_cached_user
 
 logger = get_logger()
 
@@ -72,7 +72,7 @@ class UserAuthService:
     async def verify_user_password(
             self, plain_password: str, hashed_password: str
     ) -> bool:
-        return verify_password(plain_password, hashed_password)
+        return await verify_password_async(plain_password, hashed_password)
     
     async def reset_user_state(
             self,
@@ -83,21 +83,28 @@ class UserAuthService:
             log_action: bool = True,
     ) -> None:
         previous_status = user.account_status
+        needs_commit = (
+            user.failed_login_attempts != 0
+            or user.last_failed_login is not None
+            or user.account_status == AccountStatusSchema.LOCKED
+        )
 
         user.failed_login_attempts = 0
         user.last_failed_login=None
 
         if clear_otp:
-            user.otp = ""
-            user.otp_expiry_time = None
+            await get_otp_store().discard(user.id, OTPPurposeEnum.LOGIN)
 
         if user.account_status == AccountStatusSchema.LOCKED:
             user.account_status = AccountStatusSchema.ACTIVE
 
+        if needs_commit:
             await session.commit()
 
             await session.refresh(user)
 
+            await invalidate_cached_user(user.id)
+
             if log_action and previous_status != user.account_status:
                 logger.info(
                     f"User {user.email} state reset: {previous_status} -> {user.account_status}"
@@ -136,40 +143,26 @@ class UserAuthService:
     async def generate_and_save_otp(
             self,
             user: User,
-            session: AsyncSession,
     ) -> tuple[bool, str]:
+        otp_store = get_otp_store()
         try:
-            otp = generate_otp()
-            user.otp = otp
-
-            user.otp_expiry_time = datetime.now(timezone.utc) + timedelta(minutes=settings.OTP_EXPIRATION_MINUTES)
+            otp = await otp_store.issue(
+                user.id,
+                OTPPurposeEnum.LOGIN,
+                settings.OTP_EXPIRATION_MINUTES * 60,
+            )
 
-            await session.commit()
-            await session.refresh(user)
-        
-            for attempt in range(3):
-                try:
-                    await send_login_otp_email(user.email, otp)
-                    logger.info(f"OTP sent to {user.email} successfully")
-                    return True, otp
-                except Exception as e:
-                    logger.error(f"Failed to send OTP email (attempt {attempt + 1}):{e}")
-                    if attempt == 2:
-                        user.otp_expiry_time = None
-                        await session.commit()
-                        await session.refresh(user)
-                        return False, ""
-                    
-                    await asyncio.sleep(2**attempt)
-                return False, ""
+            await send_login_otp_email(user.email, otp)
+            logger.info(f"OTP email queued for {user.email}")
+            return True, otp
 
         except Exception as e:
             logger.error(f"Failed to generate and save OTP: {e}")
 
-            user.otp = ""
-            user.otp_expiry_time = None
-            await session.commit()
-            await session.refresh(user)
+            try:
+                await otp_store.discard(user.id, OTPPurposeEnum.LOGIN)
+            except Exception as discard_error:
+                logger.error(f"Failed to discard OTP: {discard_error}")
         return False, ""
 
     async def create_user(
@@ -185,7 +178,7 @@ class UserAuthService:
          
         new_user = User(
             username=generate_username(),
-            hashed_password=generate_password_hash(password),
+            hashed_password=await generate_password_hash_async(password),
             is_active=False,
             account_status=AccountStatusSchema.PENDING,
             **user_data_dict,
@@ -248,6 +241,8 @@ class UserAuthService:
             await session.commit()
             await session.refresh(user)
 
+            await invalidate_cached_user(user.id)
+
             return user
         
         except jwt.ExpiredSignatureError:
@@ -293,7 +288,11 @@ class UserAuthService:
 
             await self.check_user_lockout(user, session)
 
-            if not user.otp or user.otp != otp:
+            otp_check = await get_otp_store().verify(
+                user.id, OTPPurposeEnum.LOGIN, otp, settings.OTP_MAX_ATTEMPTS
+            )
+
+            if otp_check in (OTPCheckEnum.INVALID, OTPCheckEnum.EXHAUSTED):
                 await self.increment_failed_login_attempts(user, session)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -304,21 +303,7 @@ class UserAuthService:
                     },
                 )
             
-            if user.otp_expiry_time is None or user.otp_expiry_time < datetime.now(
-                timezone.utc
-            ):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "status": "error",
-                        "message": "OTP has expired",
-                        "action": "Please check your OTP and try again",   
-                    },
-                )
-            
-            if user.otp_expiry_time is None or user.otp_expiry_time < datetime.now(
-                timezone.utc
-            ):
+            if otp_check == OTPCheckEnum.EXPIRED:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail={
@@ -408,6 +393,8 @@ class UserAuthService:
             await session.commit()
             await session.refresh(user)
 
+            await invalidate_cached_user(user.id)
+
     async def reset_password(
         self,
         token: str,
@@ -431,13 +418,15 @@ class UserAuthService:
                    detail={"status": "error", "message": "User not found"},
                )
            
-           user.hashed_password = generate_password_hash(new_password)
+           user.hashed_password = await generate_password_hash_async(new_password)
 
            await self.reset_user_state(user, session, clear_otp=True, log_action=True)
 
            await session.commit()
            await session.refresh(user)
 
+           await invalidate_cached_user(user.id)
+
            logger.info(f"Password reset successful for user {user.email}")
         
         except jwt.ExpiredSignatureError:
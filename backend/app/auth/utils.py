@@ -9,6 +9,7 @@ from argon2.exceptions import VerifyMismatchError
 from fastapi import Response
 
 from backend.app.core.config import settings
+from backend.app.core.utils.offload import run_in_hashing_pool
 
 _ph = PasswordHasher()
 
@@ -24,6 +25,12 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return _ph.verify(hashed_password, password)
     except VerifyMismatchError:
         return False
+
+async def generate_password_hash_async(password: str) -> str:
+    return await run_in_hashing_pool(generate_password_hash, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await run_in_hashing_pool(verify_password, password, hashed_password)
     
 def generate_username() -> str:
     bank_name = settings.SITE_NAME
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
@@ -16,7 +17,7 @@ class BankAccountBaseSchema(SQLModel):
     account_status: AccountStatusEnum = Field(default=AccountStatusEnum.Pending)
     account_number: str | None = Field(default=None, unique=True, index=True)
     account_name: str
-    balance: float = Field(default=0.0)
+    balance: Decimal = Field(default=Decimal("0.00"), max_digits=20, decimal_places=2)
     is_primary: bool = Field(default=False)
     kyc_submitted: bool = Field(default=False)
     kyc_verified: bool = Field(default=False)
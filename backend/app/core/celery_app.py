@@ -12,6 +12,7 @@ celery_app.conf.update(
     task_track_started=True,
     result_serializer="json",
     accept_content=["application/json"],
+    broker_transport_options={"confirm_publish": True},
     result_backend_max_retries=10,
     task_send_sent_event=True,
     result_extended=True,
@@ -31,6 +32,16 @@ celery_app.conf.update(
     worker_max_memory_per_child=50000,
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s]%(message)s",
     worker_task_log_format="[%(asctime)s: %(levelname)s/%(processName)s]%(task_name)s(%(task_id)s)] %(message)s",
+    beat_schedule={
+        "sweep-expired-records": {
+            "task": "sweep_expired_records",
+            "schedule": settings.MAINTENANCE_SWEEP_INTERVAL_SECONDS,
+        },
+        "relay-email-outbox": {
+            "task": "relay_email_outbox",
+            "schedule": settings.EMAIL_OUTBOX_RELAY_INTERVAL_SECONDS,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(
@@ -15,6 +15,19 @@ class Settings(BaseSettings):
     PROJECT_DESCRIPTION: str=""
     SITE_NAME: str=""
     DATABASE_URL: str=""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 5
+    DB_READ_POOL_TIMEOUT_SECONDS: int = 60
+    DB_SYNC_POOL_SIZE: int = 2
+    DB_SYNC_MAX_OVERFLOW: int = 2
+    DATABASE_REPLICA_URLS: list[str] = []
+    READ_AFTER_WRITE_PIN_SECONDS: int = 5
+
     MAIL_FROM: str=""
     MAIL_FROM_NAME: str = ""
     MAILGUN_SMTP_SERVER: str = "smtp.mailgun.org"
@@ -35,6 +48,10 @@ class Settings(BaseSettings):
     RABBITMQ_USER: str = "guest"
     RABBITMQ_PASSWORD: str = "guest"
 
+    HEALTH_CHECK_REFRESH_INTERVAL_SECONDS: float = 15.0
+    HEALTH_CHECK_CELERY_PING_TIMEOUT_SECONDS: float = 1.0
+    STARTUP_TIMEOUT_SECONDS: float = 30.0
+
     OTP_EXPIRATION_MINUTES: int=2 if ENVIRONMENT == "local" else 5
     LOGIN_ATTEMPTS: int = 3
     LOCKOUT_DURATION_MINUTES: int=2 if ENVIRONMENT == "local" else 5
@@ -72,6 +89,36 @@ class Settings(BaseSettings):
     CURRENCY_CODE_KES: str = "04"
     MAX_BANK_ACCOUNTS: int = 30 if ENVIRONMENT == "local" else 5
 
+    STATEMENT_STREAMING_THRESHOLD: int = 1000
+    STATEMENT_STREAM_CHUNK_SIZE: int = 500
+    STATEMENT_STORE_BACKEND: Literal["filesystem", "redis"] = "filesystem"
+    STATEMENT_STORE_DIR: str = ""
+    STATEMENT_TTL_SECONDS: int = 3600
+
+    IDEMPOTENCY_STORE_BACKEND: Literal["redis", "memory"] = "redis"
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 24 * 60 * 60
+
+    MAINTENANCE_SWEEP_INTERVAL_SECONDS: int = 300
+    MAINTENANCE_BATCH_SIZE: int = 5000
+    STALE_TRANSFER_TIMEOUT_MINUTES: int = 30
+
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS_ENABLED: bool = True
+    USER_CACHE_RESUBSCRIBE_DELAY_SECONDS: float = 1.0
+
+    PASSWORD_HASHING_MAX_CONCURRENCY: int = 4
+
+    OTP_STORE_BACKEND: Literal["redis", "memory"] = "redis"
+    OTP_MAX_ATTEMPTS: int = 5
+
+    EMAIL_OUTBOX_RELAY_INTERVAL_SECONDS: int = 5
+    EMAIL_OUTBOX_BATCH_SIZE: int = 500
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 10
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_RENDER_IN_WORKER: bool = False
+    EMAIL_TEMPLATE_CACHE_DIR: str = ""
+
     CLOUDINARY_CLOUD_NAME: str = ""
     CLOUDINARY_API_KEY: str = ""
     CLOUDINARY_API_SECRET: str =""
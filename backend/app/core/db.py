@@ -1,37 +1,281 @@
 import asyncio
+import itertools
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import Engine, create_engine, event, exc, make_url, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.orm import ORMExecuteState
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 from backend.app.core.model_registry import load_models
+from backend.app.core.redis_client import get_async_redis
 
 logger = get_logger()
 
-engine = create_async_engine(settings.DATABASE_URL,
-                             poolclass=AsyncAdaptedQueuePool,
-                             pool_pre_ping=True,
-                             pool_size=5,
-                             max_overflow=10,
-                             pool_timeout=30,
-                             pool_recycle=1800,
-                             )
+
+class PoolWaitStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if timed_out:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3)
+            if self.checkouts
+            else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+pool_wait_stats: dict[str, PoolWaitStats] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        stats = pool_wait_stats.setdefault(self.logging_name or "default", PoolWaitStats())
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        stats.record(time.perf_counter() - started)
+        return connection
+
+
+def _log_disconnect(context: ExceptionContext) -> None:
+    if context.is_disconnect:
+        logger.warning(
+            f"Database connection lost, invalidating pooled connections: {context.original_exception}"
+        )
+
+
+def create_pooled_engine(
+    name: str, url: str, pool_size: int, max_overflow: int, pool_timeout: int
+) -> AsyncEngine:
+    pooled_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    event.listen(pooled_engine.sync_engine, "handle_error", _log_disconnect)
+    return pooled_engine
+
+
+engine = create_pooled_engine(
+    "oltp",
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+)
+
+read_engine = create_pooled_engine(
+    "read",
+    settings.DATABASE_URL,
+    pool_size=settings.DB_READ_POOL_SIZE,
+    max_overflow=settings.DB_READ_MAX_OVERFLOW,
+    pool_timeout=settings.DB_READ_POOL_TIMEOUT_SECONDS,
+)
+
+replica_engines = [
+    create_pooled_engine(
+        f"replica_{index}",
+        url,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+        pool_timeout=settings.DB_READ_POOL_TIMEOUT_SECONDS,
+    )
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+
+current_user_id: ContextVar[uuid.UUID | None] = ContextVar(
+    "current_user_id", default=None
+)
+
+
+class PrimarySession(Session):
+    pass
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flushed_writes(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_dml_writes(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_writer_to_primary(session: Session) -> None:
+    user_id = current_user_id.get()
+    if session.info.pop("has_writes", False) and user_id:
+        session_router.pin_local(user_id)
+        session.info["pinned_user_id"] = user_id
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop("has_writes", None)
+
 
 async_session = async_sessionmaker(
     engine,
     expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=PrimarySession,
+)
+
+read_async_session = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
     class_=AsyncSession
 )
 
 
-async def get_session() -> AsyncGenerator[AsyncSession,None]:
-    session = async_session()
+class SessionRouter:
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replicas: list[async_sessionmaker],
+        pin_seconds: int,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.pin_seconds = pin_seconds
+        self._next_replica = itertools.cycle(replicas) if replicas else None
+        self._local_pins: dict[str, float] = {}
+
+    def _pin_key(self, user_id: uuid.UUID | str) -> str:
+        return f"read_pin:{user_id}"
+
+    def pin_local(self, user_id: uuid.UUID | str) -> None:
+        now = time.monotonic()
+        if len(self._local_pins) > 10000:
+            self._local_pins = {
+                key: expires_at
+                for key, expires_at in self._local_pins.items()
+                if expires_at > now
+            }
+        self._local_pins[str(user_id)] = now + self.pin_seconds
+
+    async def pin(self, user_id: uuid.UUID | str) -> None:
+        self.pin_local(user_id)
+        if not self.replicas:
+            return
+        try:
+            await get_async_redis().set(self._pin_key(user_id), "1", ex=self.pin_seconds)
+        except Exception as e:
+            logger.warning(f"Failed to store read pin for {user_id}: {e}")
+
+    async def is_pinned(self, user_id: uuid.UUID | str) -> bool:
+        expires_at = self._local_pins.get(str(user_id))
+        if expires_at:
+            if expires_at > time.monotonic():
+                return True
+            self._local_pins.pop(str(user_id), None)
+        try:
+            return bool(await get_async_redis().exists(self._pin_key(user_id)))
+        except Exception as e:
+            logger.warning(f"Read pin lookup failed, using primary: {e}")
+            return True
+
+    async def read_factory(
+        self, user_id: uuid.UUID | str | None = None
+    ) -> async_sessionmaker:
+        if not self._next_replica:
+            return self.primary
+        if user_id and await self.is_pinned(user_id):
+            return self.primary
+        return next(self._next_replica)
+
+
+session_router = SessionRouter(
+    primary=read_async_session,
+    replicas=[
+        async_sessionmaker(
+            replica_engine, expire_on_commit=False, class_=AsyncSession
+        )
+        for replica_engine in replica_engines
+    ],
+    pin_seconds=settings.READ_AFTER_WRITE_PIN_SECONDS,
+)
+
+
+@lru_cache
+def get_sync_engine() -> Engine:
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql+psycopg")
+    return create_engine(
+        url,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_SYNC_POOL_SIZE,
+        max_overflow=settings.DB_SYNC_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+
+
+def get_pool_stats() -> dict:
+    stats = {}
+    named_engines = [("oltp", engine), ("read", read_engine)] + [
+        (f"replica_{index}", replica_engine)
+        for index, replica_engine in enumerate(replica_engines)
+    ]
+    for name, pooled_engine in named_engines:
+        pool = pooled_engine.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            **pool_wait_stats.get(name, PoolWaitStats()).snapshot(),
+        }
+    return stats
+
+
+@asynccontextmanager
+async def _session_scope(
+    session_factory: Callable[[], AsyncSession],
+) -> AsyncGenerator[AsyncSession,None]:
+    session = session_factory()
     try:
         yield session
+        pinned_user_id = session.info.pop("pinned_user_id", None)
+        if pinned_user_id:
+            await session_router.pin(pinned_user_id)
     except Exception as e:
         logger.error(f"Database session error: {e}")
         if session:
@@ -49,10 +293,33 @@ async def get_session() -> AsyncGenerator[AsyncSession,None]:
             except Exception as close_error:
                 logger.error(f"Error closing database session: {close_error}") 
 
-async def init_db() -> None:
+
+async def get_session() -> AsyncGenerator[AsyncSession,None]:
+    async with _session_scope(async_session) as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession,None]:
+    async with _session_scope(await session_router.read_factory()) as session:
+        yield session
+
+
+@asynccontextmanager
+async def read_session_scope(
+    user_id: uuid.UUID | str | None = None,
+) -> AsyncGenerator[AsyncSession,None]:
+    async with _session_scope(await session_router.read_factory(user_id)) as session:
+        yield session
+
+
+async def init_db() -> float:
     try:
+        started = time.perf_counter()
         load_models()
-        logger.info("Modules loaded successfully")
+        load_models_seconds = time.perf_counter() - started
+        logger.info(
+            f"Modules loaded successfully in {load_models_seconds * 1000:.1f}ms"
+        )
         max_retries = 3
         retry_delay = 2
 
@@ -61,7 +328,7 @@ async def init_db() -> None:
                 async with engine.begin() as conn:
                     await conn.execute(text("SELECT 1"))
                 logger.info("Database connection verified succefully")
-                break
+                return load_models_seconds
             except Exception:
                 if attempt == max_retries - 1:
                     logger.error(
@@ -1,21 +1,56 @@
-from jinja2 import Environment, FileSystemLoader
+import json
 
-from backend.app.core.emails.config import TEMPLATES_DIR
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.emails.models import EmailOutbox
+from backend.app.core.emails.outbox import dispatch_email
+from backend.app.core.emails.rendering import render_email
 from backend.app.core.logging import get_logger
-from backend.app.core.tasks.email import send_email_task
 
 logger = get_logger()
 
-email_env = Environment(
-    loader=FileSystemLoader(TEMPLATES_DIR),
-    autoescape=True,
-)
-
 class EmailTemplate:
     template_name: str
     template_name_plain: str
     subject: str
 
+    @classmethod
+    def render_payload(
+        cls,
+        email_to: str | list[str],
+        context: dict,
+        subject_override: str | None = None,
+    ) -> dict:
+        recipients_list = [email_to] if isinstance(email_to, str) else email_to
+
+        if not cls.template_name or not cls.template_name_plain:
+            raise ValueError(
+                "Both HTML and plain text email templates are requireted"
+            )
+
+        payload = {
+            "recipients": recipients_list,
+            "subject": subject_override or cls.subject,
+        }
+
+        if settings.EMAIL_RENDER_IN_WORKER:
+            return {
+                **payload,
+                "template_name": cls.template_name,
+                "template_name_plain": cls.template_name_plain,
+                "context": json.loads(json.dumps(context, default=str)),
+            }
+
+        html_content, plain_content = render_email(
+            cls.template_name, cls.template_name_plain, context
+        )
+        return {
+            **payload,
+            "html_content": html_content,
+            "plain_content": plain_content,
+        }
+
     @classmethod
     async def send_email(
         cls,
@@ -24,29 +59,21 @@ class EmailTemplate:
         subject_override: str | None = None,
     ) -> None:
         try:
-            recipients_list = [email_to] if isinstance(email_to, str) else email_to
-
-            if not cls.template_name or not cls.template_name_plain:
-                raise ValueError(
-                    "Both HTML and plain text email templates are requireted"
-                )
-            
-            html_template = email_env.get_template(cls.template_name)
-            plain_template = email_env.get_template(cls.template_name_plain)
-
-            html_content = html_template.render(**context)
-            plain_content = plain_template.render(**context)
-
-            task = send_email_task.delay(
-                recipients=recipients_list,
-                subject=subject_override or cls.subject,
-                html_content=html_content,
-                plain_content=plain_content,
+            await dispatch_email(
+                cls.render_payload(email_to, context, subject_override)
             )
-            logger.info(f"Email task {task.id} queued for: {recipients_list}")
-
         except Exception as e:
-            logger.error(
-                f"Failed to queue email task for {recipients_list}: Error: {str(e)}"
-            )
-            raise
\ No newline at end of file
+            logger.error(f"Failed to queue email task for {email_to}: Error: {str(e)}")
+            raise
+
+    @classmethod
+    def add_to_outbox(
+        cls,
+        session: AsyncSession,
+        email_to: str | list[str],
+        context: dict,
+        subject_override: str | None = None,
+    ) -> None:
+        session.add(
+            EmailOutbox(payload=cls.render_payload(email_to, context, subject_override))
+        )
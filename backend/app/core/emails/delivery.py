@@ -0,0 +1,111 @@
+import asyncio
+import os
+from email.message import EmailMessage
+from email.utils import formataddr, formatdate, make_msgid
+from functools import lru_cache
+
+import aiosmtplib
+
+from backend.app.core.emails.config import email_conf
+from backend.app.core.emails.rendering import render_email
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+def build_message(payload: dict) -> EmailMessage:
+    if payload.get("template_name"):
+        html_content, plain_content = render_email(
+            payload["template_name"],
+            payload["template_name_plain"],
+            payload.get("context") or {},
+        )
+    else:
+        html_content, plain_content = payload["html_content"], payload["plain_content"]
+
+    message = EmailMessage()
+    message["Subject"] = payload["subject"]
+    message["From"] = (
+        formataddr((email_conf.MAIL_FROM_NAME, email_conf.MAIL_FROM))
+        if email_conf.MAIL_FROM_NAME
+        else email_conf.MAIL_FROM
+    )
+    message["To"] = ", ".join(payload["recipients"])
+    message["Date"] = formatdate(localtime=True)
+    message["Message-ID"] = make_msgid()
+    message.set_content(plain_content)
+    message.add_alternative(html_content, subtype="html")
+    return message
+
+
+class SMTPConnection:
+    def __init__(self):
+        self._smtp: aiosmtplib.SMTP | None = None
+
+    async def _open(self, smtp: aiosmtplib.SMTP) -> None:
+        await smtp.connect()
+        if email_conf.USE_CREDENTIALS:
+            await smtp.login(
+                email_conf.MAIL_USERNAME, email_conf.MAIL_PASSWORD.get_secret_value()
+            )
+
+    async def _client(self) -> aiosmtplib.SMTP:
+        if self._smtp is None:
+            self._smtp = aiosmtplib.SMTP(
+                hostname=email_conf.MAIL_SERVER,
+                port=email_conf.MAIL_PORT,
+                timeout=email_conf.TIMEOUT,
+                use_tls=email_conf.MAIL_SSL_TLS,
+                start_tls=email_conf.MAIL_STARTTLS,
+                validate_certs=email_conf.VALIDATE_CERTS,
+            )
+        if not self._smtp.is_connected:
+            await self._open(self._smtp)
+        return self._smtp
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            self._smtp.close()
+
+    async def _send(self, message: EmailMessage) -> dict:
+        smtp = await self._client()
+        try:
+            errors, _ = await smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            await self._open(smtp)
+            errors, _ = await smtp.send_message(message)
+        return errors
+
+    async def send_messages(self, payloads: list[dict]) -> list[dict]:
+        if email_conf.SUPPRESS_SEND:
+            return []
+
+        failed = []
+        for index, payload in enumerate(payloads):
+            try:
+                refused = await self._send(build_message(payload))
+            except (OSError, aiosmtplib.SMTPAuthenticationError) as e:
+                logger.error(f"SMTP connection failed mid-batch: {e}")
+                failed.extend(payloads[index:])
+                self.close()
+                break
+            except Exception as e:
+                logger.error(f"Failed to send email to {payload['recipients']}: {e}")
+                failed.append(payload)
+                continue
+
+            if refused:
+                logger.warning(f"SMTP refused some recipients: {refused}")
+        return failed
+
+
+@lru_cache
+def _get_delivery_runtime(
+    pid: int,
+) -> tuple[asyncio.AbstractEventLoop, SMTPConnection]:
+    return asyncio.new_event_loop(), SMTPConnection()
+
+
+def deliver_emails(payloads: list[dict]) -> list[dict]:
+    loop, connection = _get_delivery_runtime(os.getpid())
+    return loop.run_until_complete(connection.send_messages(payloads))
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class EmailOutboxStatusEnum(str, Enum):
+    Pending = "pending"
+    Failed = "failed"
@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Index, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Column, Field, SQLModel
+
+from backend.app.core.emails.enums import EmailOutboxStatusEnum
+
+
+class EmailOutbox(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_emailoutbox_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'Pending'"),
+        ),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4,
+    )
+    payload: dict = Field(sa_column=Column(JSONB, nullable=False))
+    status: EmailOutboxStatusEnum = Field(default=EmailOutboxStatusEnum.Pending)
+    attempts: int = Field(default=0)
+    last_error: str | None = Field(default=None)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
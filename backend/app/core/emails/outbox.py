@@ -0,0 +1,29 @@
+import anyio
+
+from backend.app.core.db import async_session
+from backend.app.core.emails.models import EmailOutbox
+from backend.app.core.logging import get_logger
+from backend.app.core.tasks.email import send_email_task
+
+logger = get_logger()
+
+
+def publish_email(payload: dict) -> str:
+    return send_email_task.apply_async(kwargs=payload, retry=False).id
+
+
+async def dispatch_email(payload: dict) -> None:
+    try:
+        task_id = await anyio.to_thread.run_sync(publish_email, payload)
+        logger.info(f"Email task {task_id} queued for: {payload['recipients']}")
+        return
+    except Exception as e:
+        logger.warning(
+            f"Failed to publish email for {payload['recipients']}, writing to outbox: {e}"
+        )
+        last_error = str(e)
+
+    async with async_session() as session:
+        session.add(EmailOutbox(payload=payload, attempts=1, last_error=last_error))
+        await session.commit()
+    logger.info(f"Email for {payload['recipients']} stored in outbox")
@@ -0,0 +1,31 @@
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from backend.app.core.config import settings
+from backend.app.core.emails.config import TEMPLATES_DIR
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+email_env = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=True,
+    auto_reload=settings.ENVIRONMENT == "local",
+    bytecode_cache=FileSystemBytecodeCache(settings.EMAIL_TEMPLATE_CACHE_DIR or None),
+)
+
+
+def precompile_email_templates() -> int:
+    templates = email_env.list_templates()
+    for template_name in templates:
+        email_env.get_template(template_name)
+    logger.info(f"Precompiled {len(templates)} email templates")
+    return len(templates)
+
+
+def render_email(
+    template_name: str, template_name_plain: str, context: dict
+) -> tuple[str, str]:
+    return (
+        email_env.get_template(template_name).render(**context),
+        email_env.get_template(template_name_plain).render(**context),
+    )
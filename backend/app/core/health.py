@@ -2,10 +2,13 @@ import asyncio
 from typing import Dict, Any,Callable,Awaitable,Optional
 from datetime import datetime, timedelta,timezone
 from enum import Enum
+import anyio
 from sqlalchemy import text
+from backend.app.core.config import settings
 from backend.app.core.db import async_session
 from backend.app.core.celery_app import celery_app
 from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_async_redis
 
 logger = get_logger()
 
@@ -28,10 +31,12 @@ class HealthCheck:
         self._max_retries: Dict[str,int] = {}
         self._lock = asyncio.Lock()
         self._dependencies: Dict[str,set[str]] = {}
+        self._critical: set[str] = set()
 
         self._cache_duration: timedelta = timedelta(seconds=25)
         self._cached_status: Optional[Dict[str,Any]] = None
         self._last_check_time: Optional[datetime] = None
+        self._refresh_task: Optional[asyncio.Task] = None
 
     async def validate_dependencies(self, service_name: str, depends_on: list[str]) -> None:
         if not depends_on:
@@ -46,9 +51,12 @@ class HealthCheck:
     async def add_service(
             self,service_name: str, check_function: Callable[[], Awaitable[bool]], timeout: float=5.0, retry_delay: float = 1.0,
             max_retries: int = 3,
-            depends_on: list[str] | None = None
+            depends_on: list[str] | None = None,
+            critical: bool = True,
     )-> None:
         self._services[service_name] = ServiceStatus.STARTING
+        if critical:
+            self._critical.add(service_name)
         self._check_functions[service_name] = check_function
         self._timeouts[service_name] = timeout
         self._retry_delays[service_name] = retry_delay
@@ -77,30 +85,31 @@ class HealthCheck:
 
     async def check_redis(self) -> bool:
         try:
-                redis_client = celery_app.backend.client
-                redis_client.ping()
+                await get_async_redis().ping()
                 self._last_check["redis"] = datetime.now(timezone.utc)
                 return True
         except Exception as e:
                 logger.error(f"Redis health check failed: {e}")
                 return False
-            
+
+    def _ping_celery(self) -> None:
+        inspect = celery_app.control.inspect(
+            timeout=settings.HEALTH_CHECK_CELERY_PING_TIMEOUT_SECONDS
+        )
+        workers = inspect.ping()
+
+        if not workers:
+            conn = celery_app.connection()
+            try:
+                conn.ensure_connection(max_retries=3)
+                logger.warning("No celery workers found, but Rabbitmq is reachable")
+            finally:
+                conn.close()
+
     async def check_celery(self) -> bool:
         try:
-                inspect = celery_app.control.inspect()
-                workers = inspect.ping()
-
-                if not workers:
-                    conn = celery_app.connection()
-                    try:
-                        conn.ensure_connection(max_retries=3)
-                        logger.warning("No celery workers found, but Rabbitmq is reachable")
-                        self._last_check["celery"] = datetime.now(timezone.utc)
-                        return True
-                    finally:
-                          conn.close()
-        
-                self._last_check["celer"] = datetime.now(timezone.utc)
+                await anyio.to_thread.run_sync(self._ping_celery, abandon_on_cancel=True)
+                self._last_check["celery"] = datetime.now(timezone.utc)
                 return True
         except Exception as e:
             logger.error(f"Celery health check failed: {e}")
@@ -160,16 +169,28 @@ class HealthCheck:
             return ServiceStatus.UNHEALTHY
         
     async def check_all_services(self)-> Dict[str, Any]:
+            if self._cached_status is not None and self._refresh_task is not None:
+                return self._cached_status
+
             current_time = datetime.now(timezone.utc)
             if (
                 self._cached_status is not None
                 and self._last_check_time is not None
                 and (current_time - self._last_check_time) < self._cache_duration):
                 return self._cached_status
-            
+
+            return await self.refresh_status()
+
+    async def refresh_status(self, critical_only: bool = False) -> Dict[str, Any]:
+            current_time = datetime.now(timezone.utc)
             async with self._lock:
                 services = list(self._services.keys())
-            tasks=[self.check_service_health(service) for service in services]
+            tasks=[
+                self.check_service_health(service)
+                if not critical_only or service in self._critical
+                else self._current_status(service)
+                for service in services
+            ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             health_status = {
@@ -185,25 +206,41 @@ class HealthCheck:
                         "error": str(result),
                         "last_check": self._last_check[service].isoformat()
                     }
-                    health_status["status"] = ServiceStatus.DEGRADED
+                    health_status["status"] = self._degrade(health_status["status"], service)
                 else:
                     health_status["services"][service] = {
                         "status": result,
                         "last_check": self._last_check[service].isoformat()
                     }
                     if result != ServiceStatus.HEALTHY:
-                        health_status["status"] = ServiceStatus.DEGRADED
+                        health_status["status"] = self._degrade(health_status["status"], service)
             self._cached_status = health_status
             self._last_check_time = current_time
 
             return health_status
     
+    async def _current_status(self, service_name: str) -> ServiceStatus:
+        return self._services[service_name]
+
+    def _degrade(self, overall: ServiceStatus, service_name: str) -> ServiceStatus:
+        if service_name in self._critical:
+            return ServiceStatus.UNHEALTHY
+        if overall == ServiceStatus.UNHEALTHY:
+            return overall
+        return ServiceStatus.DEGRADED
+
+    def is_ready(self) -> bool:
+        return bool(self._critical) and all(
+            self._services.get(service) == ServiceStatus.HEALTHY
+            for service in self._critical
+        )
+
     async def wait_for_services(self,timeout: float=30.0) -> bool:
         try:
                 start_time = datetime.now()
                 while(datetime.now() - start_time) < timedelta(seconds=timeout):
-                    status = await self.check_all_services()
-                    if status["status"] == ServiceStatus.HEALTHY:
+                    await self.refresh_status(critical_only=True)
+                    if self.is_ready():
                         return True
                     await asyncio.sleep(1)
                 return False
@@ -211,7 +248,32 @@ class HealthCheck:
             logger.error(f"Error waiting for services: {e}")
             return False
     
+    async def _refresh_periodically(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh_status()
+            except Exception as e:
+                logger.error(f"Background health refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    def start_background_refresh(self, interval: float) -> None:
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(
+                self._refresh_periodically(interval)
+            )
+
+    async def stop_background_refresh(self) -> None:
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
     async def cleanup(self) -> None:
+         await self.stop_background_refresh()
          async with self._lock:
               self._services.clear()
               self._check_functions.clear()
@@ -219,5 +281,9 @@ class HealthCheck:
               self._timeouts.clear()
               self._retry_delays.clear()
               self._max_retries.clear()
+              self._dependencies.clear()
+              self._critical.clear()
+              self._cached_status = None
+              self._last_check_time = None
 
 health_checker = HealthCheck()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from backend.app.core.config import settings
+from backend.app.core.redis_client import get_async_redis
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    async def get_response(self, key: str) -> dict | None: ...
+
+    @abstractmethod
+    async def set_response(self, key: str, response: dict, ttl_seconds: int) -> None: ...
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    def _response_key(self, key: str) -> str:
+        return f"idempotency:response:{key}"
+
+    async def get_response(self, key: str) -> dict | None:
+        response = await get_async_redis().get(self._response_key(key))
+        return json.loads(response) if response else None
+
+    async def set_response(self, key: str, response: dict, ttl_seconds: int) -> None:
+        await get_async_redis().set(
+            self._response_key(key), json.dumps(response, default=str), ex=ttl_seconds
+        )
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    def __init__(self):
+        self._responses: dict[str, tuple[dict, float]] = {}
+
+    async def get_response(self, key: str) -> dict | None:
+        cached = self._responses.get(key)
+        if not cached:
+            return None
+        response, expires_at = cached
+        if expires_at <= time.monotonic():
+            self._responses.pop(key, None)
+            return None
+        return response
+
+    async def set_response(self, key: str, response: dict, ttl_seconds: int) -> None:
+        self._responses[key] = (response, time.monotonic() + ttl_seconds)
+
+
+@lru_cache
+def get_idempotency_store() -> IdempotencyStore:
+    if settings.IDEMPOTENCY_STORE_BACKEND == "memory":
+        return InMemoryIdempotencyStore()
+    return RedisIdempotencyStore()
@@ -1,11 +1,23 @@
 import importlib
 import os
 import pathlib
+import sys
+from functools import lru_cache
 
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
 
+MODEL_MODULES: tuple[str, ...] = (
+    "backend.app.auth.models",
+    "backend.app.bank_account.models",
+    "backend.app.core.emails.models",
+    "backend.app.next_of_kin.models",
+    "backend.app.transaction.models",
+    "backend.app.user_profile.models",
+    "backend.app.virtual_card.models",
+)
+
 def discover_models()-> list[str]:
     models_modules = []
     root_path = pathlib.Path(__file__).parent.parent
@@ -15,7 +27,7 @@ def discover_models()-> list[str]:
     for root, _, files in os.walk(root_path):
 
         if any(excluded in root for excluded in ["venv", "__pycache__", ".pytest_cache"]):
-        
+
                continue
         if "models.py" in files:
              rel_path = os.path.relpath(root, root_path)
@@ -26,19 +38,27 @@ def discover_models()-> list[str]:
              else:
                   full_module_path = f"backend.app.{module_path}.models"
 
-            
+
              logger.debug(f"Discovered models file in: {full_module_path}")
-            
+
              models_modules.append(full_module_path)
-        
+
     return models_modules
 
+@lru_cache
 def load_models() -> None:
-    modules = discover_models()
-    for module_path in modules:
+    for module_path in MODEL_MODULES:
         try:
             importlib.import_module(module_path)
             logger.debug(f"Imported module {module_path}")
         except ImportError as e:
             logger.error(f"Failed to import module {module_path}: {e}")
-        
+
+
+if __name__ == "__main__":
+    missing = sorted(set(discover_models()) - set(MODEL_MODULES))
+    stale = sorted(set(MODEL_MODULES) - set(discover_models()))
+    if missing or stale:
+        print(f"MODEL_MODULES is out of date. Missing: {missing} Stale: {stale}")
+        sys.exit(1)
+    print(f"MODEL_MODULES matches {len(MODEL_MODULES)} models.py files")
@@ -0,0 +1,125 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from enum import Enum
+from functools import lru_cache
+
+from backend.app.auth.utils import generate_otp
+from backend.app.core.config import settings
+from backend.app.core.redis_client import get_async_redis
+
+
+class OTPPurposeEnum(str, Enum):
+    LOGIN = "login"
+    TRANSFER = "transfer"
+
+
+class OTPCheckEnum(str, Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    EXPIRED = "expired"
+    EXHAUSTED = "exhausted"
+
+
+class OTPStore(ABC):
+    @abstractmethod
+    async def issue(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, ttl_seconds: int
+    ) -> str: ...
+
+    @abstractmethod
+    async def verify(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, otp: str, max_attempts: int
+    ) -> OTPCheckEnum: ...
+
+    @abstractmethod
+    async def discard(self, user_id: uuid.UUID, purpose: OTPPurposeEnum) -> None: ...
+
+    def _key(self, user_id: uuid.UUID, purpose: OTPPurposeEnum) -> str:
+        return f"otp:{purpose.value}:{user_id}"
+
+
+VERIFY_OTP_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 'expired'
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 'valid'
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return 'exhausted'
+end
+return 'invalid'
+"""
+
+
+class RedisOTPStore(OTPStore):
+    async def issue(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, ttl_seconds: int
+    ) -> str:
+        otp = generate_otp()
+        key = self._key(user_id, purpose)
+        async with get_async_redis().pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={"code": otp, "attempts": 0})
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+        return otp
+
+    async def verify(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, otp: str, max_attempts: int
+    ) -> OTPCheckEnum:
+        result = await get_async_redis().eval(
+            VERIFY_OTP_SCRIPT, 1, self._key(user_id, purpose), otp, max_attempts
+        )
+        return OTPCheckEnum(result.decode() if isinstance(result, bytes) else result)
+
+    async def discard(self, user_id: uuid.UUID, purpose: OTPPurposeEnum) -> None:
+        await get_async_redis().delete(self._key(user_id, purpose))
+
+
+class InMemoryOTPStore(OTPStore):
+    def __init__(self):
+        self._entries: dict[str, dict] = {}
+
+    async def issue(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, ttl_seconds: int
+    ) -> str:
+        otp = generate_otp()
+        self._entries[self._key(user_id, purpose)] = {
+            "code": otp,
+            "attempts": 0,
+            "expires_at": time.monotonic() + ttl_seconds,
+        }
+        return otp
+
+    async def verify(
+        self, user_id: uuid.UUID, purpose: OTPPurposeEnum, otp: str, max_attempts: int
+    ) -> OTPCheckEnum:
+        key = self._key(user_id, purpose)
+        entry = self._entries.get(key)
+        if not entry or entry["expires_at"] <= time.monotonic():
+            self._entries.pop(key, None)
+            return OTPCheckEnum.EXPIRED
+        if entry["code"] == otp:
+            del self._entries[key]
+            return OTPCheckEnum.VALID
+        entry["attempts"] += 1
+        if entry["attempts"] >= max_attempts:
+            del self._entries[key]
+            return OTPCheckEnum.EXHAUSTED
+        return OTPCheckEnum.INVALID
+
+    async def discard(self, user_id: uuid.UUID, purpose: OTPPurposeEnum) -> None:
+        self._entries.pop(self._key(user_id, purpose), None)
+
+
+@lru_cache
+def get_otp_store() -> OTPStore:
+    if settings.OTP_STORE_BACKEND == "memory":
+        return InMemoryOTPStore()
+    return RedisOTPStore()
@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from redis import Redis
+from redis import asyncio as aioredis
+
+from backend.app.core.config import settings
+
+REDIS_URL = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+
+
+@lru_cache
+def get_async_redis(url: str = REDIS_URL) -> aioredis.Redis:
+    return aioredis.from_url(url)
+
+
+@lru_cache
+def get_redis(url: str = REDIS_URL) -> Redis:
+    return Redis.from_url(url)
@@ -1,3 +1,5 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -6,14 +8,14 @@ class AccountActivatedEmail(EmailTemplate):
     template_name_plain = "account_activated.txt"
     subject = "Your Bank Account Has been Activated"
 
-async def send_account_activated_email(
+def send_account_activated_email(
         email: str,
         full_name: str,
         account_number: str,
         account_name: str,
         account_type: str,
         currency: str,
-
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -24,4 +26,4 @@ async def send_account_activated_email(
         "support_email" : settings.SUPPORT_EMAIL,
     }
 
-    await AccountActivatedEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    AccountActivatedEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
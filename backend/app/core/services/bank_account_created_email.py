@@ -1,3 +1,5 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -7,7 +9,7 @@ class AccountCreatedEmail(EmailTemplate):
     subject = "Welcome - Your Bank Account Has been Created"
 
 
-async def send_account_created_email(
+def send_account_created_email(
         email: str,
         full_name: str,
         account_number: str,
@@ -15,6 +17,7 @@ async def send_account_created_email(
         account_type: str,
         currency: str,
         identification_type: str,
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -26,4 +29,4 @@ async def send_account_created_email(
         "site_name" : settings.SITE_NAME,
         "support_email" : settings.SUPPORT_EMAIL,
     }
-    await AccountCreatedEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    AccountCreatedEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
@@ -1,4 +1,7 @@
 from datetime import datetime
+from decimal import Decimal
+
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
@@ -8,7 +11,7 @@ class VirtualCardActivatedEmail(EmailTemplate):
     template_name_plain = "card_activated.txt"
     subject = "Your Virtual Card is Now Active"
 
-async def send_card_activated_email(
+def send_card_activated_email(
         email: str,
         full_name: str,
         card_type: str,
@@ -18,7 +21,8 @@ async def send_card_activated_email(
         daily_limit: float,
         monthly_limit: float,
         expiry_date: str,
-        available_balance: float,
+        available_balance: Decimal,
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -35,4 +39,4 @@ async def send_card_activated_email(
           "activated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
     }
 
-    await VirtualCardActivatedEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    VirtualCardActivatedEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
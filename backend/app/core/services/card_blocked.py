@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -9,7 +11,7 @@ class VirtualCardBlockedEmail(EmailTemplate):
     subject = "Your Virtual Card Has Been Blocked"
 
 
-async def send_csrd_blocked_email(
+def send_csrd_blocked_email(
         email: str,
         full_name: str,
         card_type: str,
@@ -17,6 +19,7 @@ async def send_csrd_blocked_email(
         blcok_reason: str,
         block_reason_description: str,
         blocked_at: datetime,
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name" : full_name,
@@ -29,4 +32,4 @@ async def send_csrd_blocked_email(
         "blocked_at" : blocked_at.strftime("%Y-%m-%d %H:%M:%S UTC"),
     }
 
-    await VirtualCardBlockedEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    VirtualCardBlockedEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -10,7 +12,7 @@ class VirtualCardCreatedEmail(EmailTemplate):
     subject = "Your Virtual Card Has been Created"
 
 
-async def send_card_created_email(
+def send_card_created_email(
     email: str,
     full_name: str,
     card_type: str,
@@ -20,6 +22,7 @@ async def send_card_created_email(
     daily_limit: float,
     monthly_limit: float,
     expiry_date: str,
+    session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -35,4 +38,4 @@ async def send_card_created_email(
         "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
     }
 
-    await VirtualCardCreatedEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    VirtualCardCreatedEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
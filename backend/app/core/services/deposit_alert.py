@@ -1,6 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -9,7 +11,7 @@ class DepositAlertEmail(EmailTemplate):
     template_name_plain = "deposit_alert.txt"
     subject = "Deposit Alert"
 
-async def send_deposit_alert(
+def send_deposit_alert(
         email: str,
         full_name: str,
         action: str,
@@ -21,6 +23,7 @@ async def send_deposit_alert(
         transaction_date: datetime,
         reference: str,
         balance: Decimal,
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -36,4 +39,4 @@ async def send_deposit_alert(
         "site_name" : settings.SITE_NAME,
         "suport_email" : settings.SUPPORT_EMAIL,
     }
-    await DepositAlertEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    DepositAlertEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
@@ -1,6 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.bank_account.enums import AccountCurrencyEnum
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
@@ -14,7 +16,7 @@ class TransferAlertEmail(EmailTemplate):
     template_name_plain = "transfer_alert.txt"
     subject = "Transfer Notification"
 
-async def send_transfer_alert(
+def send_transfer_alert(
         *,
         sender_email: str,
         sender_name: str,
@@ -33,6 +35,7 @@ async def send_transfer_alert(
         transaction_date: datetime,
         sender_balance: Decimal,
         receiver_balance: Decimal,
+        session: AsyncSession,
 ) -> None:
     try:
         conversion_applied = sender_currency != receiver_currency
@@ -95,22 +98,22 @@ async def send_transfer_alert(
                 }
             )
 
-        await TransferAlertEmail.send_email(
-            email_to=sender_email, context=sender_context
+        TransferAlertEmail.add_to_outbox(
+            session, email_to=sender_email, context=sender_context
         )
 
-        await TransferAlertEmail.send_email(
-            email_to=receiver_email, context=receiver_context
+        TransferAlertEmail.add_to_outbox(
+            session, email_to=receiver_email, context=receiver_context
         )
 
         logger.info(
-            f"Transfer alerts sent successfully. Reference: {reference}, "
+            f"Transfer alerts queued successfully. Reference: {reference}, "
             f"Sender: {sender_email}, Receiver: {receiver_email}"
         )
 
     except Exception as e:
         logger.error(
-            f"Failed to send transfer alerts. Reference: {reference}, Error: {str(e)}"
+            f"Failed to queue transfer alerts. Reference: {reference}, Error: {str(e)}"
         )
         raise
     
\ No newline at end of file
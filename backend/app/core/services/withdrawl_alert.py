@@ -1,6 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -10,7 +12,7 @@ class WithdrawalAlertEmail(EmailTemplate):
     subject = "Withdrawal Alert"
 
 
-async def send_withdrwal_alert(
+def send_withdrwal_alert(
         email: str,
         full_name: str,
         amount: Decimal,
@@ -21,7 +23,7 @@ async def send_withdrwal_alert(
         transaction_date: datetime,
         reference: str,
         balance: Decimal,
-
+        session: AsyncSession,
 ) -> None:
     context = {
         "full_name": full_name,
@@ -37,4 +39,4 @@ async def send_withdrwal_alert(
         "support_email": settings.SUPPORT_EMAIL,
     }
 
-    await WithdrawalAlertEmail.send_email(email_to=email, context=context)
\ No newline at end of file
+    WithdrawalAlertEmail.add_to_outbox(session, email_to=email, context=context)
\ No newline at end of file
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import BinaryIO
+
+import anyio
+from redis import asyncio as aioredis
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import REDIS_URL, get_async_redis
+
+logger = get_logger()
+
+CHUNK_SIZE = 64 * 1024
+
+DEFAULT_STATEMENT_DIR = os.path.join(tempfile.gettempdir(), "nextgen_statements")
+
+
+class StatementReader(ABC):
+    size: int
+
+    @abstractmethod
+    def iter_range(self, start: int, end: int) -> AsyncIterator[bytes]: ...
+
+    async def close(self) -> None:
+        return None
+
+
+class StatementStore(ABC):
+    @abstractmethod
+    def save(self, statement_id: str, source: BinaryIO, ttl_seconds: int) -> None: ...
+
+    @abstractmethod
+    async def open(self, statement_id: str) -> StatementReader | None: ...
+
+    def purge_expired(self) -> int:
+        return 0
+
+
+class FileSystemStatementStore(StatementStore):
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, statement_id: str) -> str:
+        return os.path.join(self.directory, f"{os.path.basename(statement_id)}.bin")
+
+    def save(self, statement_id: str, source: BinaryIO, ttl_seconds: int) -> None:
+        path = self._path(statement_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(source, f, CHUNK_SIZE)
+        expires_at = time.time() + ttl_seconds
+        os.utime(tmp_path, (expires_at, expires_at))
+        os.replace(tmp_path, path)
+
+    def _open(self, statement_id: str) -> "FileStatementReader | None":
+        path = self._path(statement_id)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        stat = os.fstat(f.fileno())
+        if stat.st_mtime < time.time() or not stat.st_size:
+            f.close()
+            if stat.st_size:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            return None
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        return FileStatementReader(f, mapped)
+
+    async def open(self, statement_id: str) -> "FileStatementReader | None":
+        return await anyio.to_thread.run_sync(self._open, statement_id)
+
+    def purge_expired(self) -> int:
+        purged = 0
+        now = time.time()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".bin") and entry.stat().st_mtime < now:
+                    try:
+                        os.remove(entry.path)
+                        purged += 1
+                    except FileNotFoundError:
+                        pass
+        return purged
+
+
+class FileStatementReader(StatementReader):
+    def __init__(self, f: BinaryIO, mapped: mmap.mmap):
+        self._file = f
+        self._mapped = mapped
+        self.size = len(mapped)
+
+    async def iter_range(self, start: int, end: int) -> AsyncIterator[bytes]:
+        try:
+            position = start
+            while position <= end:
+                chunk_end = min(position + CHUNK_SIZE, end + 1)
+                yield await anyio.to_thread.run_sync(
+                    lambda: self._mapped[position:chunk_end]
+                )
+                position = chunk_end
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        self._mapped.close()
+        self._file.close()
+
+
+class RedisStatementStore(StatementStore):
+    def __init__(self, url: str):
+        self.url = url
+
+    @property
+    def _async_client(self) -> aioredis.Redis:
+        return get_async_redis(self.url)
+
+    def _key(self, statement_id: str) -> str:
+        return f"statement:{statement_id}"
+
+    def save(self, statement_id: str, source: BinaryIO, ttl_seconds: int) -> None:
+        client = celery_app.backend.client
+        key = self._key(statement_id)
+        partial_key = f"{key}:partial"
+        client.delete(partial_key)
+        while chunk := source.read(CHUNK_SIZE):
+            client.append(partial_key, chunk)
+        client.expire(partial_key, ttl_seconds)
+        client.rename(partial_key, key)
+
+    async def open(self, statement_id: str) -> "RedisStatementReader | None":
+        key = self._key(statement_id)
+        size = await self._async_client.strlen(key)
+        if not size:
+            return None
+        return RedisStatementReader(self._async_client, key, size)
+
+
+class RedisStatementReader(StatementReader):
+    def __init__(self, client: aioredis.Redis, key: str, size: int):
+        self._client = client
+        self._key = key
+        self.size = size
+
+    async def iter_range(self, start: int, end: int) -> AsyncIterator[bytes]:
+        position = start
+        while position <= end:
+            chunk_end = min(position + CHUNK_SIZE, end + 1)
+            chunk = await self._client.getrange(self._key, position, chunk_end - 1)
+            if len(chunk) != chunk_end - position:
+                raise RuntimeError(f"{self._key} expired while it was being streamed")
+            yield chunk
+            position = chunk_end
+
+
+@lru_cache
+def get_statement_store() -> StatementStore:
+    if settings.STATEMENT_STORE_BACKEND == "redis":
+        return RedisStatementStore(REDIS_URL)
+    return FileSystemStatementStore(settings.STATEMENT_STORE_DIR or DEFAULT_STATEMENT_DIR)
+
+
+def statement_cache_key(*parts: object) -> str:
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f"statement_cache:{digest}"
+
+
+async def get_cached_statement(cache_key: str) -> dict | None:
+    cached = await get_async_redis().get(cache_key)
+    return json.loads(cached) if cached else None
+
+
+async def cache_statement(cache_key: str, statement: dict, ttl_seconds: int) -> bool:
+    return bool(
+        await get_async_redis().set(
+            cache_key, json.dumps(statement), ex=ttl_seconds, nx=True
+        )
+    )
+
+
+async def discard_cached_statement(cache_key: str) -> None:
+    await get_async_redis().delete(cache_key)
+
+
+def evict_cached_statement(cache_key: str) -> None:
+    celery_app.backend.client.delete(cache_key)
@@ -1,5 +1,6 @@
-from .email import send_email_task
+from .email import relay_email_outbox, send_email_batch_task, send_email_task
 from .image_upload import upload_profile_image_task
-from .statement import generate_statement_pdf
+from .maintenance import sweep_expired_records
+from .statement import generate_statement_pdf, stream_statement_pdf
 
-__al__ = ["send_email_task", "upload_profile_image_task","generate_statement_pdf"]
\ No newline at end of file
+__al__ = ["send_email_task", "send_email_batch_task", "relay_email_outbox", "upload_profile_image_task","generate_statement_pdf", "stream_statement_pdf", "sweep_expired_records"]
\ No newline at end of file
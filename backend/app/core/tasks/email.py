@@ -1,11 +1,25 @@
-import asyncio
-from fastapi_mail import MessageSchema,MessageType,MultipartSubtypeEnum
+from aiosmtplib import SMTPException
+from celery.signals import worker_process_init
+from sqlmodel import Session, col, delete, select
 from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import get_sync_engine
 from backend.app.core.logging import get_logger
-from backend.app.core.emails.config import fastemail
+from backend.app.core.emails.delivery import deliver_emails
+from backend.app.core.emails.enums import EmailOutboxStatusEnum
+from backend.app.core.emails.models import EmailOutbox
+from backend.app.core.emails.rendering import precompile_email_templates
+from backend.app.core.model_registry import load_models
 
 logger = get_logger()
 
+
+@worker_process_init.connect
+def warm_email_templates(**kwargs) -> None:
+    if settings.EMAIL_RENDER_IN_WORKER:
+        precompile_email_templates()
+
+
 @celery_app.task(
     name="send_email_task",
     bind=True,
@@ -17,21 +31,114 @@ logger = get_logger()
 )
 
 def send_email_task(
-    self,*,recipients: list[str], subject: str, html_content:str, 
-    plain_content: str
+    self,*,recipients: list[str], subject: str, html_content: str | None = None,
+    plain_content: str | None = None, template_name: str | None = None,
+    template_name_plain: str | None = None, context: dict | None = None,
 ) -> bool:
     try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=recipients,
-            body=html_content,
-            subtype=MessageType.html,
-            alternative_body=plain_content,
-            multipart_subtype=MultipartSubtypeEnum.alternative
+        failed = deliver_emails(
+            [
+                {
+                    "recipients": recipients,
+                    "subject": subject,
+                    "html_content": html_content,
+                    "plain_content": plain_content,
+                    "template_name": template_name,
+                    "template_name_plain": template_name_plain,
+                    "context": context,
+                }
+            ]
         )
-        asyncio.run(fastemail.send_message(message))
+        if failed:
+            raise SMTPException(f"SMTP server rejected email to {recipients}")
         logger.info(f"Email successfully sent to {recipients} with subject {subject}")
         return True
     except Exception as e:
-        logger.error(f"Failed to send email to {recipients}: Error: {str(e)}")
-        return False
\ No newline at end of file
+        logger.error(
+            f"Failed to send email to {recipients} (attempt {self.request.retries + 1}): Error: {str(e)}"
+        )
+        raise
+
+
+@celery_app.task(
+    name="send_email_batch_task",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=240,
+)
+def send_email_batch_task(self, *, messages: list[dict]) -> int:
+    try:
+        failed = deliver_emails(messages)
+    except Exception as e:
+        logger.error(f"Failed to send email batch of {len(messages)}: {e}")
+        raise self.retry(exc=e, countdown=min(2**self.request.retries * 5, 60))
+
+    sent = len(messages) - len(failed)
+    logger.info(f"Email batch sent: {sent} delivered, {len(failed)} failed")
+
+    if failed:
+        raise self.retry(
+            kwargs={"messages": failed},
+            countdown=min(2**self.request.retries * 5, 60),
+        )
+    return sent
+
+
+@celery_app.task(
+    name="relay_email_outbox",
+    bind=True,
+    soft_time_limit=120,
+)
+def relay_email_outbox(self) -> int:
+    load_models()
+
+    published = 0
+    with Session(get_sync_engine()) as session:
+        while True:
+            entries = session.exec(
+                select(EmailOutbox)
+                .where(EmailOutbox.status == EmailOutboxStatusEnum.Pending)
+                .order_by(EmailOutbox.created_at)
+                .limit(settings.EMAIL_OUTBOX_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not entries:
+                break
+
+            published_ids = []
+            with celery_app.producer_or_acquire() as producer:
+                for start in range(0, len(entries), settings.EMAIL_BATCH_SIZE):
+                    batch = entries[start : start + settings.EMAIL_BATCH_SIZE]
+                    try:
+                        send_email_batch_task.apply_async(
+                            kwargs={"messages": [entry.payload for entry in batch]},
+                            producer=producer,
+                        )
+                        published_ids.extend(entry.id for entry in batch)
+                    except Exception as e:
+                        logger.error(f"Failed to relay {len(batch)} outbox emails: {e}")
+                        for entry in batch:
+                            entry.attempts += 1
+                            entry.last_error = str(e)
+                            if entry.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                                entry.status = EmailOutboxStatusEnum.Failed
+                                logger.error(
+                                    f"Outbox email {entry.id} to "
+                                    f"{entry.payload['recipients']} failed after "
+                                    f"{entry.attempts} attempts, giving up"
+                                )
+                            session.add(entry)
+
+            if published_ids:
+                session.exec(
+                    delete(EmailOutbox).where(col(EmailOutbox.id).in_(published_ids))
+                )
+            session.commit()
+            published += len(published_ids)
+
+            if len(published_ids) < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                break
+
+    if published:
+        logger.info(f"Relayed {published} emails from the outbox")
+    return published
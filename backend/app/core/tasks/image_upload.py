@@ -7,6 +7,7 @@ import cloudinary.uploader
 from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.user_cache import invalidate_cached_user_sync
 
 logger = get_logger()
 
@@ -94,6 +95,7 @@ def upload_profile_image_task(
             f"Thumbnail: {response.get('thumbnail_url', 'No thumbnail')}, "
             f"Public ID: {response['public_id']}"
         )
+        invalidate_cached_user_sync(user_id)
         return response
     except ValueError as e:
         logger.error(f"Validation error in profile image upload: {str(e)}")
@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import cast, literal, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.dml import DMLWhereBase
+from sqlmodel import Session, col, delete, func, select, update
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import get_sync_engine
+from backend.app.core.logging import get_logger
+from backend.app.core.model_registry import load_models
+from backend.app.core.statement_store import get_statement_store
+from backend.app.transaction.enums import (
+    TransactionFailureReason,
+    TransactionStatusEnum,
+    TransactionTypeEnum,
+)
+from backend.app.transaction.models import IdempotencyKey, Transaction
+
+logger = get_logger()
+
+
+def _run_in_batches(session: Session, statement: DMLWhereBase) -> int:
+    processed = 0
+    while True:
+        result = session.exec(statement)
+        session.commit()
+        processed += result.rowcount
+        if result.rowcount < settings.MAINTENANCE_BATCH_SIZE:
+            return processed
+
+
+def _delete_expired_idempotency_keys(session: Session, now: datetime) -> int:
+    expired = (
+        select(IdempotencyKey.id)
+        .where(IdempotencyKey.expires_at < now)
+        .limit(settings.MAINTENANCE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    return _run_in_batches(
+        session, delete(IdempotencyKey).where(col(IdempotencyKey.id).in_(expired))
+    )
+
+
+def _fail_stale_pending_transfers(session: Session, now: datetime) -> int:
+    cutoff = now - timedelta(minutes=settings.STALE_TRANSFER_TIMEOUT_MINUTES)
+    stale = (
+        select(Transaction.id)
+        .where(
+            Transaction.status == TransactionStatusEnum.Pending,
+            Transaction.transaction_type == TransactionTypeEnum.Transfer,
+            Transaction.created_at < cutoff,
+        )
+        .order_by(Transaction.created_at)
+        .limit(settings.MAINTENANCE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    failure_details = {
+        "failure_details": {
+            "reason": TransactionFailureReason.OTP_EXPIRED.value,
+            "timestamp": now.isoformat(),
+            "error_message": "Transfer was not completed before the OTP expired",
+        }
+    }
+    return _run_in_batches(
+        session,
+        update(Transaction)
+        .where(col(Transaction.id).in_(stale))
+        .values(
+            status=TransactionStatusEnum.Failed,
+            failed_reason=TransactionFailureReason.OTP_EXPIRED.value,
+            transaction_metadata=func.coalesce(
+                Transaction.transaction_metadata, cast(text("'{}'"), JSONB)
+            ).op("||")(literal(failure_details, JSONB)),
+        ),
+    )
+
+
+@celery_app.task(
+    name="sweep_expired_records",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=240,
+)
+def sweep_expired_records(self) -> dict:
+    load_models()
+
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+
+    try:
+        with Session(get_sync_engine()) as session:
+            metrics = {
+                "idempotency_keys_deleted": _delete_expired_idempotency_keys(
+                    session, now
+                ),
+                "pending_transfers_failed": _fail_stale_pending_transfers(
+                    session, now
+                ),
+            }
+        metrics["statements_purged"] = get_statement_store().purge_expired()
+        metrics["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        logger.info(f"Maintenance sweep completed: {metrics}")
+        return metrics
+    except Exception as e:
+        logger.error(f"Maintenance sweep failed: {e}")
+        raise self.retry(exc=e, countdown=60)
@@ -1,253 +1,404 @@
+import tempfile
+import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
-from io import BytesIO
+from typing import BinaryIO
 
 from celery import Task
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    Flowable,
+    Frame,
+    LayoutError,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle,
+)
+from sqlmodel import Session, select
 
+from backend.app.auth.models import User
+from backend.app.bank_account.models import BankAccount
 from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
+from backend.app.core.db import get_sync_engine
 from backend.app.core.logging import get_logger
+from backend.app.core.model_registry import load_models
+from backend.app.core.statement_store import (
+    evict_cached_statement,
+    get_statement_store,
+)
+from backend.app.transaction.utils import (
+    build_statement_transaction_row,
+    build_statement_transactions_query,
+    build_statement_user_data,
+)
 
 logger = get_logger()
 
+PAGE_WIDTH, PAGE_HEIGHT = A4
+
+MARGIN = 72
+
+USABLE_WIDTH = PAGE_WIDTH - (2 * MARGIN)
+
+USABLE_HEIGHT = PAGE_HEIGHT - (2 * MARGIN)
+
 
 class StatementGenerationTask(Task):
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         logger.error(f"Statement generation failed: {exc}", exc_info=einfo)
+        if kwargs.get("cache_key"):
+            evict_cached_statement(kwargs["cache_key"])
         super().on_failure(exc, task_id, args, kwargs, einfo)
 
 
-@celery_app.task(
-    base=StatementGenerationTask,
-    name="generate_statement_pdf",
-    bind=True,
-    max_retries=3,
-    soft_time_limit=300,
-)
-def generate_statement_pdf(self, statement_data: dict, statement_id: str) -> dict:
-    try:
-        buffer = BytesIO()
-        PAGE_WIDTH = A4[0]
+def _statement_styles():
+    styles = getSampleStyleSheet()
 
-        MARGIN = 72
+    styles.add(
+        ParagraphStyle(name="SmallText", parent=styles["Normal"], fontSize=8)
+    )
 
-        USABLE_WIDTH = PAGE_WIDTH - (2 * MARGIN)
-
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=MARGIN,
-            leftMargin=MARGIN,
-            topMargin=MARGIN,
-            bottomMargin=MARGIN,
+    styles.add(
+        ParagraphStyle(
+            name="AccountInfo", parent=styles["Normal"], fontSize=10, spaceAfter=6
         )
-
-        styles = getSampleStyleSheet()
-
-        styles.add(
-            ParagraphStyle(name="SmallText", parent=styles["Normal"], fontSize=8)
+    )
+
+    styles.add(
+        ParagraphStyle(
+            name="SectionTitle",
+            parent=styles["Heading3"],
+            fontSize=12,
+            spaceAfter=6,
+            alignment=1,
         )
+    )
+    return styles
 
-        styles.add(
-            ParagraphStyle(
-                name="AccountInfo", parent=styles["Normal"], fontSize=10, spaceAfter=6
-            )
-        )
 
-        styles.add(
-            ParagraphStyle(
-                name="SectionTitle",
-                parent=styles["Heading3"],
-                fontSize=12,
-                spaceAfter=6,
-                alignment=1,
-            )
-        )
+def _statement_header(statement_data: dict, styles) -> list[Flowable]:
+    elements = []
 
-        elements = []
-
-        elements.append(
-            Paragraph(f"{settings.SITE_NAME} Account Statement", styles["Heading1"])
-        )
+    elements.append(
+        Paragraph(f"{settings.SITE_NAME} Account Statement", styles["Heading1"])
+    )
 
-        elements.append(Spacer(1, 12))
+    elements.append(Spacer(1, 12))
 
-        elements.append(
-            Paragraph(
-                f"Statement Period: {statement_data['start_date']} to {statement_data['end_date']}",
-                styles["Normal"],
-            )
+    elements.append(
+        Paragraph(
+            f"Statement Period: {statement_data['start_date']} to {statement_data['end_date']}",
+            styles["Normal"],
         )
+    )
+
+    elements.append(Spacer(1, 12))
+
+    user = statement_data["user"]
+
+    account = (
+        user["accounts"][0]
+        if statement_data.get("is_single_account")
+        else user["accounts"][0]
+    )
+
+    col_width = USABLE_WIDTH / 2
+
+    user_info = [
+        [Paragraph("Customer Information:", styles["Heading4"]), ""],
+        ["Name:", user["full_name"]],
+        ["Username:", user["username"]],
+        ["Email:", user["email"]],
+    ]
+
+    account_info = [
+        [Paragraph("Account Information:", styles["Heading4"]), ""],
+        ["Account Number:", account["account_number"]],
+        ["Account Name:", account["account_name"]],
+        ["Account Type:", account["account_type"]],
+        ["Currency:", account["currency"]],
+        ["Current Balance:", str(account["balance"])],
+    ]
+    table_style = TableStyle(
+        [
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            (
+                "FONTNAME",
+                (0, 1),
+                (0, -1),
+                "Helvetica-Bold",
+            ),
+            ("FONTNAME", (1, 1), (1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("SPAN", (0, 0), (1, 0)),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ]
+    )
 
-        elements.append(Spacer(1, 12))
+    label_width = col_width * 0.4
+    value_width = col_width * 0.6
 
-        user = statement_data["user"]
+    user_table = Table(user_info, colWidths=[label_width, value_width])
 
-        account = (
-            user["accounts"][0]
-            if statement_data.get("is_single_account")
-            else user["accounts"][0]
-        )
+    user_table.setStyle(table_style)
 
-        col_width = USABLE_WIDTH / 2
+    account_table = Table(account_info, colWidths=[label_width, value_width])
 
-        user_info = [
-            [Paragraph("Customer Information:", styles["Heading4"]), ""],
-            ["Name:", user["full_name"]],
-            ["Username:", user["username"]],
-            ["Email:", user["email"]],
-        ]
+    account_table.setStyle(table_style)
 
-        account_info = [
-            [Paragraph("Account Information:", styles["Heading4"]), ""],
-            ["Account Number:", account["account_number"]],
-            ["Account Name:", account["account_name"]],
-            ["Account Type:", account["account_type"]],
-            ["Currency:", account["currency"]],
-            ["Current Balance:", str(account["balance"])],
-        ]
-        table_style = TableStyle(
+    wrapper_table = Table(
+        [[user_table, account_table]],
+        colWidths=[col_width, col_width],
+        spaceBefore=10,
+        spaceAfter=10,
+    )
+
+    wrapper_table.setStyle(
+        TableStyle(
             [
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                (
-                    "FONTNAME",
-                    (0, 1),
-                    (0, -1),
-                    "Helvetica-Bold",
-                ),
-                ("FONTNAME", (1, 1), (1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("SPAN", (0, 0), (1, 0)),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 10),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 10),
             ]
         )
+    )
 
-        label_width = col_width * 0.4
-        value_width = col_width * 0.6
+    elements.append(wrapper_table)
+    elements.append(Spacer(1, 20))
+    return elements
 
-        user_table = Table(user_info, colWidths=[label_width, value_width])
 
-        user_table.setStyle(table_style)
+def _transaction_table(transactions: list[dict]) -> Table:
+    table_data = [["Date", "Reference", "Description", "Type", "Amount", "Balance"]]
 
-        account_table = Table(account_info, colWidths=[label_width, value_width])
+    for txn in transactions:
+        amount_str = (
+            f"+{txn["amount"]}"
+            if txn["transaction_category"] == "credit"
+            else f"-{txn["amount"]}"
+        )
+        description = (
+            txn["description"][:30] + "..."
+            if len(txn["description"]) > 30
+            else txn["description"]
+        )
+        table_data.append(
+            [
+                txn["created_at"],
+                txn["reference"],
+                description,
+                txn["transaction_type"],
+                amount_str,
+                txn["balance_after"],
+            ]
+        )
+    col_ratios = [0.12, 0.20, 0.30, 0.15, 0.11, 0.12]
 
-        account_table.setStyle(table_style)
+    trans_col_widths = [USABLE_WIDTH * ratio for ratio in col_ratios]
 
-        wrapper_table = Table(
-            [[user_table, account_table]],
-            colWidths=[col_width, col_width],
-            spaceBefore=10,
-            spaceAfter=10,
+    trans_table = Table(table_data, colWidths=trans_col_widths, repeatRows=1)
+
+    trans_table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTSIZE", (0, 0), (-1, 0), 10),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
+                ("FONTSIZE", (0, 1), (-1, -1), 8),
+                ("ALIGN", (0, 1), (-1, -1), "CENTER"),
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ]
         )
+    )
+    return trans_table
+
+
+def _statement_elements(
+    statement_data: dict, transaction_chunks: Iterable[list[dict]]
+) -> Iterator[Flowable]:
+    styles = _statement_styles()
+
+    yield from _statement_header(statement_data, styles)
+
+    chunks = iter(transaction_chunks)
+    first_chunk = next(chunks, None)
+
+    if first_chunk:
+        yield Paragraph("Transaction History", styles["SectionTitle"])
+        yield Spacer(1, 12)
+        yield _transaction_table(first_chunk)
+
+        for chunk in chunks:
+            yield _transaction_table(chunk)
+    else:
+        yield Paragraph("No transaction found for this period.", styles["Normal"])
+
+    yield Spacer(1, 12)
+    yield Paragraph(
+        f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        styles["SmallText"],
+    )
+    yield Paragraph(
+        "This is a computer-generated statement and does not require signature.",
+        styles["SmallText"],
+    )
+
+
+def _new_page_frame() -> Frame:
+    return Frame(MARGIN, MARGIN, USABLE_WIDTH, USABLE_HEIGHT)
+
+
+def render_statement_pdf(
+    statement_data: dict, transaction_chunks: Iterable[list[dict]], output: BinaryIO
+) -> None:
+    canvas = Canvas(output, pagesize=A4)
+    canvas.setTitle(f"{settings.SITE_NAME} Account Statement")
+    frame = _new_page_frame()
+    page_is_empty = True
+
+    for element in _statement_elements(statement_data, transaction_chunks):
+        pending = [element]
+        while pending:
+            flowable = pending.pop(0)
+            if frame.add(flowable, canvas, trySplit=1):
+                page_is_empty = False
+                continue
+
+            parts = frame.split(flowable, canvas)
+            if parts and frame.add(parts[0], canvas, trySplit=1):
+                pending[:0] = parts[1:]
+            elif page_is_empty:
+                raise LayoutError(f"{flowable.identity()} does not fit on a page")
+            else:
+                pending.insert(0, flowable)
+
+            canvas.showPage()
+            frame = _new_page_frame()
+            page_is_empty = True
+
+    canvas.save()
+
+
+def _store_statement(statement_id: str, pdf_file: BinaryIO) -> dict:
+    pdf_file.seek(0)
+    get_statement_store().save(statement_id, pdf_file, settings.STATEMENT_TTL_SECONDS)
+
+    return {
+        "status": "success",
+        "statement_id": statement_id,
+        "generated_at": datetime.now().isoformat(),
+        "expires_at": (
+            datetime.now() + timedelta(seconds=settings.STATEMENT_TTL_SECONDS)
+        ).isoformat(),
+    }
+
 
-        wrapper_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                ]
+@celery_app.task(
+    base=StatementGenerationTask,
+    name="generate_statement_pdf",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=300,
+)
+def generate_statement_pdf(
+    self, statement_data: dict, statement_id: str, cache_key: str | None = None
+) -> dict:
+    try:
+        with tempfile.TemporaryFile() as pdf_file:
+            render_statement_pdf(
+                statement_data, [statement_data["transactions"]], pdf_file
             )
-        )
+            return _store_statement(statement_id, pdf_file)
+    except Exception as e:
+        logger.error(f"Failed to generate statement: {e}")
+        raise self.retry(exc=e, countdown=5)
 
-        elements.append(wrapper_table)
-        elements.append(Spacer(1, 20))
 
-        transactions = statement_data["transactions"]
+@celery_app.task(
+    base=StatementGenerationTask,
+    name="stream_statement_pdf",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=300,
+)
+def stream_statement_pdf(
+    self,
+    user_id: str,
+    start_date: str,
+    end_date: str,
+    statement_id: str,
+    account_number: str | None = None,
+    cache_key: str | None = None,
+) -> dict:
+    load_models()
 
-        if transactions:
-            elements.append(Paragraph("Transaction History", styles["SectionTitle"]))
-            elements.append(Spacer(1, 12))
+    try:
+        start = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
 
-            table_data = [
-                ["Date", "Reference", "Description", "Type", "Amount", "Balance"]
-            ]
+        with tempfile.TemporaryFile() as pdf_file:
+            with Session(get_sync_engine()) as session:
+                user = session.get(User, uuid.UUID(user_id))
+                if not user:
+                    raise ValueError(f"User {user_id} not found")
 
-            for txn in transactions:
-                amount_str = (
-                    f"+{txn["amount"]}"
-                    if txn["transaction_category"] == "credit"
-                    else f"-{txn["amount"]}"
+                accounts_query = select(BankAccount).where(
+                    BankAccount.user_id == user.id
                 )
-                description = (
-                    txn["description"][:30] + "..."
-                    if len(txn["description"]) > 30
-                    else txn["description"]
+                if account_number:
+                    accounts_query = accounts_query.where(
+                        BankAccount.account_number == account_number
+                    )
+                accounts = session.exec(accounts_query).all()
+
+                if not accounts:
+                    raise ValueError("Account not found or does not belong to user")
+
+                statement_data = {
+                    "user": build_statement_user_data(user, accounts),
+                    "start_date": start.strftime("%Y-%m-%d"),
+                    "end_date": end.strftime("%Y-%m-%d"),
+                    "is_single_account": bool(account_number),
+                }
+
+                result = session.exec(
+                    build_statement_transactions_query(
+                        [acc.id for acc in accounts], start, end
+                    ).execution_options(
+                        yield_per=settings.STATEMENT_STREAM_CHUNK_SIZE
+                    )
                 )
-                table_data.append(
-                    [
-                        txn["created_at"],
-                        txn["reference"],
-                        description,
-                        txn["transaction_type"],
-                        amount_str,
-                        txn["balance_after"],
-                    ]
-                )
-            col_ratios = [0.12, 0.20, 0.30, 0.15, 0.11, 0.12]
-
-            trans_col_widths = [USABLE_WIDTH * ratio for ratio in col_ratios]
-
-            trans_table = Table(table_data, colWidths=trans_col_widths, repeatRows=1)
 
-            trans_table.setStyle(
-                TableStyle(
+                transaction_chunks = (
                     [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 10),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
-                        ("FONTSIZE", (0, 1), (-1, -1), 8),
-                        ("ALIGN", (0, 1), (-1, -1), "CENTER"),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                        build_statement_transaction_row(
+                            txn, sender_account, receiver_account
+                        )
+                        for txn, sender_account, receiver_account in partition
                     ]
+                    for partition in result.partitions()
                 )
-            )
-            elements.append(trans_table)
-        else:
-            elements.append(
-                Paragraph("No transaction found for this period.", styles["Normal"])
-            )
 
-        elements.append(Spacer(1, 12))
-        elements.append(
-            Paragraph(
-                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                styles["SmallText"],
-            )
-        )
-        elements.append(
-            Paragraph(
-                "This is a computer-generated statement and does not require signature.",
-                styles["SmallText"],
-            )
-        )
-
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
+                render_statement_pdf(statement_data, transaction_chunks, pdf_file)
 
-        redis_client = celery_app.backend.client
-        redis_key = f"statement:{statement_id}"
-        redis_client.setex(redis_key, 3600, pdf_data)
-
-        return {
-            "status": "success",
-            "statement_id": statement_id,
-            "generated_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(hours=1)).isoformat(),
-        }
+            logger.info(f"Streamed statement {statement_id} for user {user_id}")
+            return _store_statement(statement_id, pdf_file)
+    except ValueError as e:
+        logger.error(f"Failed to stream statement: {e}")
+        raise
     except Exception as e:
-        logger.error(f"Failed to generate statement: {e}")
+        logger.error(f"Failed to stream statement: {e}")
         raise self.retry(exc=e, countdown=5)
-    
\ No newline at end of file
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from backend.app.auth.models import User
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_async_redis, get_redis
+from backend.app.user_profile.models import Profile
+
+logger = get_logger()
+
+INVALIDATION_CHANNEL = "user_snapshot:invalidate"
+
+SENSITIVE_FIELDS = {
+    "hashed_password": "",
+    "otp": "",
+    "otp_expiry_time": None,
+    "security_answer": "",
+}
+
+
+class UserSnapshotCache:
+    def __init__(self, max_size: int, ttl_seconds: int, use_redis: bool = False):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._subscribed = False
+        self._listener_task: asyncio.Task | None = None
+
+    def _redis_key(self, user_id: str) -> str:
+        return f"user_snapshot:{user_id}"
+
+    @property
+    def _local_enabled(self) -> bool:
+        return not self.use_redis or self._subscribed
+
+    def _set_local(self, user_id: str, snapshot: dict) -> None:
+        if not self._local_enabled:
+            return
+        self._entries[user_id] = (snapshot, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, user_id: str) -> dict | None:
+        entry = self._entries.get(user_id)
+        if entry:
+            snapshot, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                return snapshot
+            self._entries.pop(user_id, None)
+
+        if not self.use_redis:
+            return None
+
+        try:
+            cached = await get_async_redis().get(self._redis_key(user_id))
+        except Exception as e:
+            logger.warning(f"User snapshot lookup failed: {e}")
+            return None
+        if not cached:
+            return None
+
+        snapshot = json.loads(cached)
+        self._set_local(user_id, snapshot)
+        return snapshot
+
+    async def set(self, user_id: str, snapshot: dict) -> None:
+        self._set_local(user_id, snapshot)
+
+        if self.use_redis:
+            try:
+                await get_async_redis().set(
+                    self._redis_key(user_id), json.dumps(snapshot), ex=self.ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache user snapshot: {e}")
+
+    async def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+        if self.use_redis:
+            try:
+                async with get_async_redis().pipeline(transaction=False) as pipe:
+                    pipe.delete(self._redis_key(user_id))
+                    pipe.publish(INVALIDATION_CHANNEL, user_id)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to invalidate user snapshot: {e}")
+
+    def invalidate_sync(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+        if self.use_redis:
+            try:
+                with get_redis().pipeline(transaction=False) as pipe:
+                    pipe.delete(self._redis_key(user_id))
+                    pipe.publish(INVALIDATION_CHANNEL, user_id)
+                    pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to invalidate user snapshot: {e}")
+
+    async def _listen_for_invalidations(self, retry_delay: float) -> None:
+        while True:
+            pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                self._entries.clear()
+                self._subscribed = True
+                async for message in pubsub.listen():
+                    self._entries.pop(message["data"].decode(), None)
+            except Exception as e:
+                logger.warning(f"User cache invalidation listener failed: {e}")
+            finally:
+                self._subscribed = False
+                self._entries.clear()
+                await pubsub.aclose()
+            await asyncio.sleep(retry_delay)
+
+    def start_invalidation_listener(self, retry_delay: float) -> None:
+        if self.use_redis and self._listener_task is None:
+            self._listener_task = asyncio.create_task(
+                self._listen_for_invalidations(retry_delay)
+            )
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+
+@lru_cache
+def get_user_cache() -> UserSnapshotCache:
+    return UserSnapshotCache(
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+        use_redis=settings.USER_CACHE_REDIS_ENABLED,
+    )
+
+
+async def get_cached_user(user_id: uuid.UUID | str) -> User | None:
+    snapshot = await get_user_cache().get(str(user_id))
+    if not snapshot:
+        return None
+
+    try:
+        user = User.model_validate({**snapshot["user"], **SENSITIVE_FIELDS})
+        set_committed_value(
+            user,
+            "profile",
+            Profile.model_validate(snapshot["profile"]) if snapshot["profile"] else None,
+        )
+    except ValueError as e:
+        logger.warning(f"Discarding invalid user snapshot for {user_id}: {e}")
+        await get_user_cache().invalidate(str(user_id))
+        return None
+    return user
+
+
+async def cache_user(user: User) -> None:
+    await get_user_cache().set(
+        str(user.id),
+        {
+            "user": user.model_dump(
+                mode="json", exclude=set(SENSITIVE_FIELDS) | {"full_name"}
+            ),
+            "profile": user.profile.model_dump(mode="json") if user.profile else None,
+        },
+    )
+
+
+async def invalidate_cached_user(user_id: uuid.UUID | str) -> None:
+    await get_user_cache().invalidate(str(user_id))
+
+
+def invalidate_cached_user_sync(user_id: uuid.UUID | str) -> None:
+    get_user_cache().invalidate_sync(str(user_id))
@@ -0,0 +1,19 @@
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+
+from backend.app.core.config import settings
+
+T = TypeVar("T")
+
+
+@lru_cache
+def get_hashing_limiter() -> CapacityLimiter:
+    return CapacityLimiter(settings.PASSWORD_HASHING_MAX_CONCURRENCY)
+
+
+async def run_in_hashing_pool(func: Callable[..., T], *args) -> T:
+    return await anyio.to_thread.run_sync(func, *args, limiter=get_hashing_limiter())
@@ -1,11 +1,21 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI,status
+import anyio
+from fastapi import Depends, FastAPI,status
 
 from backend.app.api.main import api_router
+from backend.app.api.routes.auth.deps import get_admin_user
 from backend.app.core.config import settings
-from backend.app.core.db import init_db, engine
+from backend.app.core.db import (
+    engine,
+    get_pool_stats,
+    init_db,
+    read_engine,
+    replica_engines,
+)
+from backend.app.core.emails.rendering import precompile_email_templates
 from backend.app.core.logging import get_logger
+from backend.app.core.user_cache import get_user_cache
 from fastapi.responses import JSONResponse
 from backend.app.core.health import health_checker,ServiceStatus
 import asyncio
@@ -13,7 +23,7 @@ import time
 
 logger = get_logger()
 
-async def startup_health_check(timeout: float=90.0)-> bool:
+async def startup_health_check(timeout: float=settings.STARTUP_TIMEOUT_SECONDS)-> bool:
     try:
         async with asyncio.timeout(timeout):
             retry_intervals=[1,2,5,10,15]
@@ -42,25 +52,57 @@ async def startup_health_check(timeout: float=90.0)-> bool:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
-        await init_db()
-        logger.info("Database initialized successfully")
-
-        await health_checker.add_service("database", health_checker.check_database)
-        await health_checker.add_service("celery", health_checker.check_celery)
-        await health_checker.add_service("redis", health_checker.check_redis)
-
-        if not await startup_health_check():
-            raise RuntimeError("Critical services failed to start")
-        logger.info("All services initialized and healthy")
+        started = time.perf_counter()
+        async with asyncio.timeout(settings.STARTUP_TIMEOUT_SECONDS):
+            load_models_seconds, _ = await asyncio.gather(
+                init_db(),
+                anyio.to_thread.run_sync(precompile_email_templates),
+            )
+            logger.info("Database initialized successfully")
+            initialized = time.perf_counter()
+
+            await health_checker.add_service("database", health_checker.check_database)
+            await health_checker.add_service(
+                "celery", health_checker.check_celery, timeout=2.0, max_retries=1, critical=False
+            )
+            await health_checker.add_service(
+                "redis", health_checker.check_redis, timeout=2.0, max_retries=1, critical=False
+            )
+
+            if not await startup_health_check():
+                raise RuntimeError("Critical services failed to start")
+        app.state.startup_timings = {
+            "load_models_ms": round(load_models_seconds * 1000, 2),
+            "init_ms": round((initialized - started) * 1000, 2),
+            "health_check_ms": round((time.perf_counter() - initialized) * 1000, 2),
+            "total_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info(
+            f"Critical services ready: {app.state.startup_timings}, "
+            "probing non-critical services in the background"
+        )
+        health_checker.start_background_refresh(
+            settings.HEALTH_CHECK_REFRESH_INTERVAL_SECONDS
+        )
+        get_user_cache().start_invalidation_listener(
+            settings.USER_CACHE_RESUBSCRIBE_DELAY_SECONDS
+        )
         yield
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
         await engine.dispose()
+        await read_engine.dispose()
+        for replica_engine in replica_engines:
+            await replica_engine.dispose()
         await health_checker.cleanup()
         raise
     finally:
         logger.info("Shutting down application...")
+        await get_user_cache().stop_invalidation_listener()
         await engine.dispose()
+        await read_engine.dispose()
+        for replica_engine in replica_engines:
+            await replica_engine.dispose()
         await health_checker.cleanup()
 
 
@@ -93,4 +135,35 @@ async def health_check():
                             content={"status": ServiceStatus.UNHEALTHY,"error": str(e)},
         )
 
+@app.get("/health/live", response_model=dict)
+async def liveness_check():
+    return {"status": "alive"}
+
+@app.get("/health/ready", response_model=dict)
+async def readiness_check():
+    if health_checker.is_ready():
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ready"})
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "not_ready"},
+    )
+
+@app.get(
+    "/internal/metrics/db-pools",
+    response_model=dict,
+    include_in_schema=False,
+    dependencies=[Depends(get_admin_user)],
+)
+async def db_pool_metrics():
+    return get_pool_stats()
+
+@app.get(
+    "/internal/metrics/startup",
+    response_model=dict,
+    include_in_schema=False,
+    dependencies=[Depends(get_admin_user)],
+)
+async def startup_metrics():
+    return getattr(app.state, "startup_timings", {})
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
\ No newline at end of file
@@ -35,4 +35,10 @@ class TransactionFailureReason(str, Enum):
     INVALID_AMOUNT = "invalid_amount"
     INVALID_ACCOUNT = "invalid_account"
     SELF_TRANSFER = "self_transfer"
-    SUSPICIOUS_ACTIVITY = "suspicious_activity"
\ No newline at end of file
+    SUSPICIOUS_ACTIVITY = "suspicious_activity"
+
+
+class StatementFormatEnum(str, Enum):
+    PDF = "pdf"
+    CSV = "csv"
+    JSONL = "jsonl"
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, Relationship, SQLModel
@@ -15,6 +15,28 @@ if TYPE_CHECKING:
 
 
 class Transaction(TransactionBaseSchema, table=True):
+    __table_args__ = (
+        Index(
+            "ix_transaction_sender_account_id_created_at",
+            "sender_account_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_transaction_receiver_account_id_created_at",
+            "receiver_account_id",
+            "created_at",
+            "id",
+        ),
+        Index("ix_transaction_sender_id_created_at", "sender_id", "created_at"),
+        Index("ix_transaction_receiver_id_created_at", "receiver_id", "created_at"),
+        Index(
+            "ix_transaction_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'Pending'"),
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -83,6 +105,8 @@ class Transaction(TransactionBaseSchema, table=True):
 
 
 class IdempotencyKey(SQLModel, table=True):
+    __table_args__ = (Index("ix_idempotencykey_expires_at", "expires_at"),)
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
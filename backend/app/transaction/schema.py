@@ -9,6 +9,7 @@ from sqlmodel import Column, Field, SQLModel
 from typing_extensions import Annotated
 
 from backend.app.transaction.enums import (
+    StatementFormatEnum,
     TransactionCategoryEnum,
     TransactionStatusEnum,
     TransactionTypeEnum,
@@ -113,9 +114,10 @@ class TransactionHistoryResponseSchema(SQLModel):
 
 
 class PaginatedTransactionResponseSchema(SQLModel):
-    total: int
+    total: int | None = None
     skip: int
     limit: int
+    next_cursor: str | None = None
     transactions: list[TransactionHistoryResponseSchema]
 
 
@@ -160,6 +162,10 @@ class StatementRequestSchema(SQLModel):
         max_length=16,
         description="16-digit account number for specific account statements",
     )
+    format: StatementFormatEnum = Field(
+        default=StatementFormatEnum.PDF,
+        description="pdf is rendered in the background; csv and jsonl are streamed back directly",
+    )
 
 
 class StatementResponseSchema(SQLModel):
@@ -1,8 +1,14 @@
+import base64
+import json
+import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy.orm import aliased
+from sqlmodel import any_, desc, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.app.bank_account.models import BankAccount
 from backend.app.core.logging import get_logger
 from backend.app.transaction.enums import (
     TransactionFailureReason,
@@ -10,6 +16,9 @@ from backend.app.transaction.enums import (
 )
 from backend.app.transaction.models import Transaction
 
+if TYPE_CHECKING:
+    from backend.app.auth.models import User
+
 logger = get_logger()
 
 
@@ -56,4 +65,90 @@ async def mark_transaction_failed(
     except Exception as e:
         logger.error(f"Error marking transaction as failed: {e}")
 
-        raise
\ No newline at end of file
+        raise
+
+
+def encode_history_cursor(created_at: datetime, transaction_id: uuid.UUID) -> str:
+    payload = json.dumps(
+        {"created_at": created_at.isoformat(), "id": str(transaction_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["created_at"]), uuid.UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {e}")
+
+
+def build_statement_transactions_query(
+    account_ids: list[uuid.UUID], start_date: datetime, end_date: datetime
+):
+    sender_account = aliased(BankAccount)
+    receiver_account = aliased(BankAccount)
+
+    return (
+        select(
+            Transaction,
+            sender_account.account_number,
+            receiver_account.account_number,
+        )
+        .outerjoin(sender_account, sender_account.id == Transaction.sender_account_id)
+        .outerjoin(
+            receiver_account, receiver_account.id == Transaction.receiver_account_id
+        )
+        .where(
+            or_(
+                Transaction.sender_account_id == any_(account_ids),
+                Transaction.receiver_account_id == any_(account_ids),
+            ),
+            Transaction.created_at >= start_date,
+            Transaction.created_at <= end_date,
+            Transaction.status == TransactionStatusEnum.Completed,
+        )
+        .order_by(desc(Transaction.created_at))
+    )
+
+
+def build_statement_user_data(user: "User", accounts: list[BankAccount]) -> dict:
+    return {
+        "username": user.username,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": f"{user.first_name} {user.middle_name + ' ' if user.middle_name else ''}{user.last_name}".strip(),
+        "accounts": [
+            {
+                "account_number": acc.account_number,
+                "account_name": acc.account_name,
+                "account_type": acc.account_type.value,
+                "currency": acc.currency.value,
+                "balance": str(acc.balance),
+            }
+            for acc in accounts
+            if acc.account_number
+        ],
+    }
+
+
+def build_statement_transaction_row(
+    txn: Transaction,
+    sender_account_number: str | None,
+    receiver_account_number: str | None,
+) -> dict:
+    return {
+        "reference": txn.reference,
+        "amount": str(txn.amount),
+        "description": txn.description,
+        "created_at": txn.created_at.strftime("%Y-%m-%d"),
+        "transaction_type": txn.transaction_type.value,
+        "transaction_category": txn.transaction_category.value,
+        "balance_after": str(txn.balance_after),
+        "sender_account": sender_account_number,
+        "receiver_account": receiver_account_number,
+        "metadata": txn.transaction_metadata,
+    }
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import func, text
@@ -39,8 +40,12 @@ class VirtualCard(VirtualCardBaseSchema, table=True):
     )
     cvv_hash: str | None = Field(default=None)
 
-    available_balance: float = Field(default=0.0)
-    total_topped_up: float = Field(default=0.0)
+    available_balance: Decimal = Field(
+        default=Decimal("0.00"), max_digits=20, decimal_places=2
+    )
+    total_topped_up: Decimal = Field(
+        default=Decimal("0.00"), max_digits=20, decimal_places=2
+    )
     last_top_up_date: datetime | None = Field(
         default=None,
         sa_column=Column(
@@ -58,10 +63,16 @@ class VirtualCard(VirtualCardBaseSchema, table=True):
         ),
     )
 
-    total_spend_today: float = Field(default=0.0)
-    total_spend_this_month: float = Field(default=0.0)
+    total_spend_today: Decimal = Field(
+        default=Decimal("0.00"), max_digits=20, decimal_places=2
+    )
+    total_spend_this_month: Decimal = Field(
+        default=Decimal("0.00"), max_digits=20, decimal_places=2
+    )
     last_transaction_date: datetime | None = Field(default=None)
-    last_transaction_amount: float  | None = Field(default=None)
+    last_transaction_amount: Decimal | None = Field(
+        default=None, max_digits=20, decimal_places=2
+    )
 
     physical_card_requested_at: datetime | None = Field(default=None)
     delivery_address: str | None = Field(default=None)
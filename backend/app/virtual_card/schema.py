@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from decimal import Decimal
 from uuid import UUID
 
 from pydantic import Field
@@ -49,13 +50,13 @@ class VirtualCardBlockSchema(VirtualCardBaseSchema):
 
 class VirtualCardStatusSchema(VirtualCardBaseSchema):
     card_status: VirtualCardStatusEnum = Field()
-    available_balance: float
+    available_balance: Decimal
     daily_limit: float = Field()
     monthly_limit: float = Field()
-    total_spend_today: float
-    total_spend_this_month: float
+    total_spend_today: Decimal
+    total_spend_this_month: Decimal
     last_transaction_date: datetime | None = None
-    last_transaction_amount: float | None = None
+    last_transaction_amount: Decimal | None = None
 
 class PhysicalCardRequestSchema(SQLModel):
     delivery_address: str = Field(max_length=200)
@@ -65,7 +66,7 @@ class PhysicalCardRequestSchema(SQLModel):
 
 class CardTopUpSchema(SQLModel):
     account_number: str = Field(min_length=16, max_length=16)
-    amount: float = Field(gt=0)
+    amount: Decimal = Field(gt=0, max_digits=20, decimal_places=2)
     description: str = Field(max_length=250)
 
 class CardTopUpResponseSchema(SQLModel):
@@ -4,6 +4,8 @@ from typing import Tuple
 
 from argon2 import PasswordHasher
 
+_ph = PasswordHasher()
+
 def generate_visa_card_number() -> str:
     prefix = "4"
 
@@ -26,19 +28,16 @@ def generate_visa_card_number() -> str:
 def generate_cvv() -> Tuple[str, str]:
     cvv = "".join(secrets.choice("0123456789") for _ in range(3))
 
-    ph = PasswordHasher()
-
-    cvv_hash = ph.hash(cvv)
+    cvv_hash = _ph.hash(cvv)
 
     return cvv, cvv_hash
 
 def verrify_cvv(cvv: str, cvv_hash:str) -> bool:
     try:
-        ph = PasswordHasher()
-        return ph.verify(cvv_hash, cvv)
+        return _ph.verify(cvv_hash, cvv)
     except Exception:
         return False
-    
+
 def generate_card_expiry_date() -> datetime:
     current_date = datetime.now()
     expiry_date = current_date + timedelta(days=365 * 3)
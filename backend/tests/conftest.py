@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.core.model_registry import load_models
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS")
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip_benchmark = pytest.mark.skip(reason="RUN_BENCHMARKS is not set")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    load_models()
+    engine = create_async_engine(
+        TEST_DATABASE_URL, pool_size=20, max_overflow=30, pool_timeout=120
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(db_engine) -> async_sessionmaker:
+    return async_sessionmaker(db_engine, expire_on_commit=False, class_=AsyncSession)
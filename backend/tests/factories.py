@@ -0,0 +1,86 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema, SecurityQuestionsSchema
+from backend.app.bank_account.enums import (
+    AccountCurrencyEnum,
+    AccountStatusEnum,
+    AccountTypeEnum,
+)
+from backend.app.bank_account.models import BankAccount
+from backend.app.transaction.enums import (
+    TransactionCategoryEnum,
+    TransactionStatusEnum,
+    TransactionTypeEnum,
+)
+
+
+def make_user(index: int) -> User:
+    return User(
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        first_name="Test",
+        last_name=f"User{index}",
+        id_no=100000 + index,
+        is_active=True,
+        security_question=SecurityQuestionsSchema.FAVORITE_COLOR,
+        security_answer="blue",
+        account_status=AccountStatusSchema.ACTIVE,
+        hashed_password="not-used",
+    )
+
+
+def make_account(user: User, balance: Decimal) -> BankAccount:
+    return BankAccount(
+        user_id=user.id,
+        account_type=AccountTypeEnum.Current,
+        currency=AccountCurrencyEnum.USD,
+        account_status=AccountStatusEnum.Active,
+        account_number=f"{uuid.uuid4().int % 10**16:016d}",
+        account_name=user.first_name,
+        balance=balance,
+    )
+
+
+def make_transfer_rows(
+    users: list[User],
+    accounts: list[BankAccount],
+    count: int,
+    now: datetime,
+    rng: random.Random,
+    max_age: timedelta = timedelta(days=365),
+    sender_index: int | None = None,
+) -> list[dict]:
+    max_minutes = int(max_age.total_seconds() // 60)
+    rows = []
+    for _ in range(count):
+        sender, receiver = rng.sample(range(len(users)), 2)
+        if sender_index is not None:
+            sender = sender_index
+            while receiver == sender_index:
+                receiver = rng.randrange(len(users))
+        created_at = now - timedelta(minutes=rng.randint(0, max_minutes))
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "amount": Decimal("10.00"),
+                "description": "seeded transfer",
+                "reference": f"TRF{uuid.uuid4().hex[:12].upper()}",
+                "transaction_type": TransactionTypeEnum.Transfer,
+                "transaction_category": TransactionCategoryEnum.Debit,
+                "status": TransactionStatusEnum.Completed,
+                "balance_before": Decimal("0.00"),
+                "balance_after": Decimal("0.00"),
+                "sender_account_id": accounts[sender].id,
+                "receiver_account_id": accounts[receiver].id,
+                "sender_id": users[sender].id,
+                "receiver_id": users[receiver].id,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "completed_at": created_at,
+            }
+        )
+    return rows
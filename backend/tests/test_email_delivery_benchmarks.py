@@ -0,0 +1,79 @@
+import socket
+import time
+
+import pytest
+
+from backend.app.core.emails.config import email_conf
+from backend.app.core.emails.delivery import SMTPConnection
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.received += 1
+        return "250 Message accepted for delivery"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    handler = CountingHandler()
+    controller = aiosmtpd_controller.Controller(
+        handler, hostname="127.0.0.1", port=free_port()
+    )
+    controller.start()
+
+    monkeypatch.setattr(email_conf, "MAIL_SERVER", controller.hostname)
+    monkeypatch.setattr(email_conf, "MAIL_PORT", controller.port)
+    monkeypatch.setattr(email_conf, "USE_CREDENTIALS", False)
+    monkeypatch.setattr(email_conf, "MAIL_SSL_TLS", False)
+    monkeypatch.setattr(email_conf, "MAIL_STARTTLS", False)
+    monkeypatch.setattr(email_conf, "SUPPRESS_SEND", False)
+
+    yield handler
+    controller.stop()
+
+
+def make_payloads(count: int) -> list[dict]:
+    return [
+        {
+            "recipients": [f"user{index}@example.com"],
+            "subject": "Your login OTP",
+            "template_name": "login_otp.html",
+            "template_name_plain": "login_otp.txt",
+            "context": {"otp": f"{index % 1000000:06d}", "expiry_time": 5},
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [1000, 10000])
+async def test_send_messages_throughput(smtp_server, count):
+    payloads = make_payloads(count)
+    connection = SMTPConnection()
+
+    started = time.perf_counter()
+    try:
+        failed = await connection.send_messages(payloads)
+    finally:
+        connection.close()
+    elapsed = time.perf_counter() - started
+
+    assert failed == []
+    assert smtp_server.received == count
+
+    print(
+        f"\nsend_messages {count} messages: {elapsed:.2f}s "
+        f"({count / elapsed:.0f} msg/s)"
+    )
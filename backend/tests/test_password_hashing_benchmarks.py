@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth import utils as auth_utils
+from backend.app.auth.utils import generate_password_hash, generate_password_hash_async
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+REQUEST_COUNT = 64
+PASSWORD = "correct horse battery staple"
+
+
+async def run_inline(func, *args):
+    return func(*args)
+
+
+async def measure(make_call) -> tuple[float, float]:
+    max_lag = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while running:
+            scheduled = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - scheduled - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(make_call() for _ in range(REQUEST_COUNT)))
+    elapsed = time.perf_counter() - started
+    running = False
+    await ticker_task
+    return REQUEST_COUNT / elapsed, max_lag
+
+
+@pytest.mark.parametrize("offloaded", [False, True], ids=["inline", "offloaded"])
+async def test_login_and_registration_hashing_throughput(monkeypatch, offloaded):
+    if not offloaded:
+        monkeypatch.setattr(auth_utils, "run_in_hashing_pool", run_inline)
+
+    hashed_password = generate_password_hash(PASSWORD)
+
+    async def login() -> None:
+        assert await user_auth_service.verify_user_password(PASSWORD, hashed_password)
+
+    async def register() -> None:
+        await generate_password_hash_async(PASSWORD)
+
+    login_rate, login_lag = await measure(login)
+    register_rate, register_lag = await measure(register)
+
+    mode = "offloaded" if offloaded else "inline"
+    print(
+        f"\n{mode} login: {login_rate:.1f} req/s, max loop lag {login_lag * 1000:.1f}ms"
+        f"\n{mode} registration: {register_rate:.1f} req/s, "
+        f"max loop lag {register_lag * 1000:.1f}ms"
+    )
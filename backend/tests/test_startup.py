@@ -0,0 +1,30 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+from backend.app.core.model_registry import MODEL_MODULES, discover_models
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "5"))
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def test_model_manifest_matches_models_on_disk():
+    assert sorted(MODEL_MODULES) == sorted(discover_models())
+
+
+def test_main_import_within_budget():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import time; started = time.perf_counter(); import backend.app.main; "
+            "print(time.perf_counter() - started)",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = float(result.stdout.strip().splitlines()[-1])
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import took {elapsed:.2f}s"
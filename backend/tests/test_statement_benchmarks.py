@@ -0,0 +1,117 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import desc, event, insert, or_
+from sqlmodel import select
+
+from backend.app.api.services.transaction import prepare_statement_data
+from backend.app.bank_account.models import BankAccount
+from backend.app.transaction.models import Transaction
+from backend.tests.factories import make_account, make_transfer_rows, make_user
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+COUNTERPARTY_COUNT = 500
+BATCH_SIZE = 5000
+STATEMENT_WINDOW = timedelta(days=30)
+
+
+async def seed_statement(session_factory, size: int):
+    rng = random.Random(size)
+    now = datetime.now(timezone.utc)
+
+    async with session_factory() as session:
+        users = [make_user(index) for index in range(COUNTERPARTY_COUNT + 1)]
+        session.add_all(users)
+        await session.flush()
+        accounts = [make_account(user, Decimal("0.00")) for user in users]
+        session.add_all(accounts)
+        await session.flush()
+
+        rows = make_transfer_rows(
+            users, accounts, size, now, rng, STATEMENT_WINDOW, sender_index=0
+        )
+        for start in range(0, len(rows), BATCH_SIZE):
+            await session.execute(insert(Transaction), rows[start : start + BATCH_SIZE])
+        await session.commit()
+
+    return users[0], accounts[0]
+
+
+async def prepare_rows_with_per_row_lookups(account, start_date, end_date, session):
+    result = await session.exec(
+        select(Transaction)
+        .where(
+            or_(
+                Transaction.sender_account_id == account.id,
+                Transaction.receiver_account_id == account.id,
+            ),
+            Transaction.created_at >= start_date,
+            Transaction.created_at <= end_date,
+        )
+        .order_by(desc(Transaction.created_at))
+    )
+
+    rows = []
+    for txn in result.all():
+        sender_account = await session.get(BankAccount, txn.sender_account_id)
+        receiver_account = await session.get(BankAccount, txn.receiver_account_id)
+        rows.append(
+            {
+                "reference": txn.reference,
+                "sender_account": sender_account.account_number,
+                "receiver_account": receiver_account.account_number,
+            }
+        )
+    return rows
+
+
+@contextmanager
+def captured_selects(db_engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.parametrize("size", [1000, 10000, 100000])
+async def test_prepare_statement_data_benchmark(db_engine, session_factory, size):
+    user, account = await seed_statement(session_factory, size)
+    end_date = datetime.now(timezone.utc)
+    start_date = end_date - STATEMENT_WINDOW - timedelta(days=1)
+
+    with captured_selects(db_engine) as statements:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            data = await prepare_statement_data(user.id, start_date, end_date, session)
+            joined_seconds = time.perf_counter() - started
+    joined_queries = len(statements)
+
+    with captured_selects(db_engine) as statements:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            legacy_rows = await prepare_rows_with_per_row_lookups(
+                account, start_date, end_date, session
+            )
+            legacy_seconds = time.perf_counter() - started
+    legacy_queries = len(statements)
+
+    assert len(data["transactions"]) == len(legacy_rows) == size
+    assert joined_queries <= 3
+
+    print(
+        f"\nstatement rows={size}: joined {joined_seconds * 1000:.0f}ms "
+        f"({joined_queries} queries), per-row lookups "
+        f"{legacy_seconds * 1000:.0f}ms ({legacy_queries} queries)"
+    )
@@ -0,0 +1,78 @@
+import re
+import tempfile
+
+from reportlab import rl_config
+
+from backend.app.core.tasks.statement import render_statement_pdf
+
+CHUNK_COUNT = 5
+CHUNK_SIZE = 200
+
+
+def make_statement_data() -> dict:
+    return {
+        "user": {
+            "full_name": "Test User",
+            "username": "testuser",
+            "email": "test@example.com",
+            "accounts": [
+                {
+                    "account_number": "0123456789012345",
+                    "account_name": "Test",
+                    "account_type": "current",
+                    "currency": "USD",
+                    "balance": "1000.00",
+                }
+            ],
+        },
+        "start_date": "2026-01-01",
+        "end_date": "2026-01-31",
+        "is_single_account": True,
+    }
+
+
+def make_chunks(consumed: list[int]):
+    for chunk_index in range(CHUNK_COUNT):
+        consumed.append(chunk_index)
+        yield [
+            {
+                "created_at": "2026-01-15",
+                "reference": f"TRF{chunk_index:03d}{row:05d}",
+                "description": "Statement render test",
+                "transaction_type": "transfer",
+                "transaction_category": "debit" if row % 2 else "credit",
+                "amount": "10.00",
+                "balance_after": "990.00",
+            }
+            for row in range(CHUNK_SIZE)
+        ]
+
+
+def test_render_statement_pdf_consumes_every_chunk(monkeypatch):
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+    consumed = []
+
+    with tempfile.TemporaryFile() as pdf_file:
+        render_statement_pdf(make_statement_data(), make_chunks(consumed), pdf_file)
+        pdf_file.seek(0)
+        pdf = pdf_file.read()
+
+    assert consumed == list(range(CHUNK_COUNT))
+    assert pdf.startswith(b"%PDF-")
+    assert pdf.rstrip().endswith(b"%%EOF")
+
+    references = set(re.findall(rb"\((TRF\d+)\)", pdf))
+    assert len(references) == CHUNK_COUNT * CHUNK_SIZE
+
+    page_count = len(re.findall(rb"/Type /Page\b", pdf))
+    assert page_count > CHUNK_COUNT
+    assert pdf.count(b"(Reference)") >= page_count - 1
+
+
+def test_render_statement_pdf_without_transactions():
+    with tempfile.TemporaryFile() as pdf_file:
+        render_statement_pdf(make_statement_data(), iter([]), pdf_file)
+        pdf_file.seek(0)
+        pdf = pdf_file.read()
+
+    assert len(re.findall(rb"/Type /Page\b", pdf)) == 1
@@ -0,0 +1,48 @@
+import io
+import os
+
+import pytest
+
+from backend.app.core.statement_store import CHUNK_SIZE, FileSystemStatementStore
+
+pytestmark = pytest.mark.anyio
+
+STATEMENT = os.urandom(CHUNK_SIZE * 3 + 17)
+
+
+async def read_all(reader, start: int, end: int) -> bytes:
+    return b"".join([chunk async for chunk in reader.iter_range(start, end)])
+
+
+async def test_missing_statement_is_not_opened(tmp_path):
+    store = FileSystemStatementStore(str(tmp_path))
+
+    assert await store.open("missing") is None
+
+
+async def test_expired_statement_is_not_opened(tmp_path):
+    store = FileSystemStatementStore(str(tmp_path))
+    store.save("expired", io.BytesIO(STATEMENT), ttl_seconds=-1)
+
+    assert await store.open("expired") is None
+    assert not os.listdir(tmp_path)
+
+
+async def test_open_statement_survives_purge(tmp_path):
+    store = FileSystemStatementStore(str(tmp_path))
+    store.save("statement", io.BytesIO(STATEMENT), ttl_seconds=60)
+
+    reader = await store.open("statement")
+    os.remove(store._path("statement"))
+
+    assert reader.size == len(STATEMENT)
+    assert await read_all(reader, 0, reader.size - 1) == STATEMENT
+
+
+async def test_ranges_are_streamed_exactly(tmp_path):
+    store = FileSystemStatementStore(str(tmp_path))
+    store.save("statement", io.BytesIO(STATEMENT), ttl_seconds=60)
+
+    reader = await store.open("statement")
+
+    assert await read_all(reader, 10, CHUNK_SIZE + 20) == STATEMENT[10 : CHUNK_SIZE + 21]
@@ -0,0 +1,112 @@
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from backend.app.api.services.transaction import (
+    get_statement_window_stats,
+    get_user_transactions,
+)
+from backend.app.transaction.models import Transaction
+from backend.app.transaction.utils import build_statement_transactions_query
+from backend.tests.factories import make_account, make_transfer_rows, make_user
+
+pytestmark = pytest.mark.anyio
+
+USER_COUNT = 200
+TRANSACTION_COUNT = 50000
+BATCH_SIZE = 5000
+
+
+@pytest.fixture
+async def seeded_ledger(db_engine, session_factory):
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+
+    async with session_factory() as session:
+        users = [make_user(index) for index in range(USER_COUNT)]
+        session.add_all(users)
+        await session.flush()
+        accounts = [make_account(user, Decimal("0.00")) for user in users]
+        session.add_all(accounts)
+        await session.flush()
+
+        rows = make_transfer_rows(users, accounts, TRANSACTION_COUNT, now, rng)
+        for start in range(0, len(rows), BATCH_SIZE):
+            await session.execute(insert(Transaction), rows[start : start + BATCH_SIZE])
+        await session.commit()
+
+    async with db_engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    return users[0], accounts[0]
+
+
+@contextmanager
+def captured_transaction_selects(db_engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and '"transaction"' in statement:
+            statements.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+async def assert_index_scans(db_engine, statements) -> None:
+    assert statements
+    async with db_engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plan = [row[0] for row in result.all()]
+            seq_scans = [
+                line for line in plan if "Seq Scan" in line and "transaction" in line
+            ]
+            assert not seq_scans, "\n".join(plan)
+            assert any("ix_transaction_" in line for line in plan), "\n".join(plan)
+
+
+async def test_history_queries_use_transaction_indexes(
+    db_engine, session_factory, seeded_ledger
+):
+    user, _ = seeded_ledger
+    now = datetime.now(timezone.utc)
+
+    with captured_transaction_selects(db_engine) as statements:
+        async with session_factory() as session:
+            _, _, next_cursor = await get_user_transactions(
+                user.id, session, include_total=True
+            )
+            await get_user_transactions(
+                user.id,
+                session,
+                start_date=now - timedelta(days=30),
+                end_date=now,
+                cursor=next_cursor,
+            )
+
+    await assert_index_scans(db_engine, statements)
+
+
+async def test_statement_queries_use_transaction_indexes(
+    db_engine, session_factory, seeded_ledger
+):
+    user, account = seeded_ledger
+    end_date = datetime.now(timezone.utc)
+    start_date = end_date - timedelta(days=30)
+
+    with captured_transaction_selects(db_engine) as statements:
+        async with session_factory() as session:
+            await get_statement_window_stats(user.id, start_date, end_date, session)
+            await session.exec(
+                build_statement_transactions_query([account.id], start_date, end_date)
+            )
+
+    await assert_index_scans(db_engine, statements)
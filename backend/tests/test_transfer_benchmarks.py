@@ -0,0 +1,106 @@
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import func, select
+
+from backend.app.api.services import transaction as transaction_service
+from backend.app.api.services.transaction import initiate_transfer
+from backend.app.transaction.enums import TransactionStatusEnum
+from backend.app.transaction.models import Transaction
+from backend.tests.factories import make_account, make_user
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+ACCOUNT_COUNT = 20
+SEQUENTIAL_TRANSFERS = 500
+CONCURRENT_TRANSFERS = 500
+CONCURRENCY = 20
+INITIAL_BALANCE = Decimal("1000000.00")
+
+
+class IssuingOTPStore:
+    async def issue(self, user_id, purpose, ttl_seconds) -> str:
+        return "000000"
+
+
+def latency_summary(samples: list[float]) -> str:
+    percentiles = statistics.quantiles(samples, n=100)
+    return (
+        f"p50={percentiles[49] * 1000:.2f}ms p99={percentiles[98] * 1000:.2f}ms "
+        f"max={max(samples) * 1000:.2f}ms"
+    )
+
+
+async def test_initiate_transfer_latency(db_engine, session_factory, monkeypatch):
+    monkeypatch.setattr(transaction_service, "get_otp_store", IssuingOTPStore)
+
+    async with session_factory() as session:
+        users = [make_user(index) for index in range(ACCOUNT_COUNT)]
+        session.add_all(users)
+        await session.flush()
+        accounts = [make_account(user, INITIAL_BALANCE) for user in users]
+        session.add_all(accounts)
+        await session.commit()
+
+    async def run_transfer(index: int) -> float:
+        sender = index % ACCOUNT_COUNT
+        receiver = (index + 1) % ACCOUNT_COUNT
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await initiate_transfer(
+                sender_id=users[sender].id,
+                sender_account_id=accounts[sender].id,
+                receiver_account_number=accounts[receiver].account_number,
+                amount=Decimal("1.00"),
+                description="latency benchmark",
+                security_answer=users[sender].security_answer,
+                session=session,
+            )
+            return time.perf_counter() - started
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await run_transfer(0)
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    sequential = [await run_transfer(index) for index in range(SEQUENTIAL_TRANSFERS)]
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def run_limited(index: int) -> float:
+        async with semaphore:
+            return await run_transfer(index)
+
+    concurrent = await asyncio.gather(
+        *(run_limited(index) for index in range(CONCURRENT_TRANSFERS))
+    )
+
+    async with session_factory() as session:
+        pending = (
+            await session.exec(
+                select(func.count())
+                .select_from(Transaction)
+                .where(Transaction.status == TransactionStatusEnum.Pending)
+            )
+        ).one()
+
+    assert pending == 1 + SEQUENTIAL_TRANSFERS + CONCURRENT_TRANSFERS
+    assert len(statements) <= 3, statements
+
+    print(
+        f"\ninitiate_transfer sequential ({SEQUENTIAL_TRANSFERS}): "
+        f"{latency_summary(sequential)}"
+        f"\ninitiate_transfer concurrency={CONCURRENCY} ({CONCURRENT_TRANSFERS}): "
+        f"{latency_summary(concurrent)}"
+        f"\nstatements per call: {len(statements)}"
+    )
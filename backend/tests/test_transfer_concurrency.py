@@ -0,0 +1,95 @@
+import asyncio
+import random
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlmodel import select
+
+from backend.app.api.services import transaction as transaction_service
+from backend.app.api.services.transaction import complete_transfer
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.otp_store import OTPCheckEnum
+from backend.app.transaction.enums import (
+    TransactionCategoryEnum,
+    TransactionStatusEnum,
+    TransactionTypeEnum,
+)
+from backend.app.transaction.models import Transaction
+from backend.tests.factories import make_account, make_user
+
+pytestmark = pytest.mark.anyio
+
+ACCOUNT_COUNT = 4
+TRANSFER_COUNT = 300
+INITIAL_BALANCE = Decimal("10000.00")
+
+
+class AcceptingOTPStore:
+    async def verify(self, user_id, purpose, otp, max_attempts) -> OTPCheckEnum:
+        return OTPCheckEnum.VALID
+
+
+async def test_parallel_transfers_keep_exact_balances(session_factory, monkeypatch):
+    monkeypatch.setattr(transaction_service, "get_otp_store", AcceptingOTPStore)
+
+    rng = random.Random(42)
+    async with session_factory() as session:
+        users = [make_user(index) for index in range(ACCOUNT_COUNT)]
+        session.add_all(users)
+        await session.flush()
+        accounts = [make_account(user, INITIAL_BALANCE) for user in users]
+        session.add_all(accounts)
+        await session.flush()
+
+        expected = {account.id: INITIAL_BALANCE for account in accounts}
+        references = []
+        for _ in range(TRANSFER_COUNT):
+            sender, receiver = rng.sample(range(ACCOUNT_COUNT), 2)
+            amount = Decimal(rng.randint(100, 2500)) / 100
+            reference = f"TRF{uuid.uuid4().hex[:12].upper()}"
+            session.add(
+                Transaction(
+                    amount=amount,
+                    description="concurrency test",
+                    reference=reference,
+                    transaction_type=TransactionTypeEnum.Transfer,
+                    transaction_category=TransactionCategoryEnum.Debit,
+                    status=TransactionStatusEnum.Pending,
+                    balance_before=Decimal("0"),
+                    balance_after=Decimal("0"),
+                    sender_account_id=accounts[sender].id,
+                    receiver_account_id=accounts[receiver].id,
+                    sender_id=users[sender].id,
+                    receiver_id=users[receiver].id,
+                    transaction_metadata={
+                        "conversion_rate": "1",
+                        "conversion_fee": "0",
+                        "original_amount": str(amount),
+                        "converted_amount": str(amount),
+                        "from_currency": "USD",
+                        "to_currency": "USD",
+                    },
+                )
+            )
+            expected[accounts[sender].id] -= amount
+            expected[accounts[receiver].id] += amount
+            references.append(reference)
+        await session.commit()
+
+    async def run_transfer(reference: str) -> None:
+        async with session_factory() as session:
+            await complete_transfer(reference=reference, otp="000000", session=session)
+
+    await asyncio.gather(*(run_transfer(reference) for reference in references))
+
+    async with session_factory() as session:
+        balances = {
+            account.id: account.balance
+            for account in (await session.exec(select(BankAccount))).all()
+        }
+        statuses = (await session.exec(select(Transaction.status))).all()
+
+    assert set(statuses) == {TransactionStatusEnum.Completed}
+    assert balances == expected
+    assert sum(balances.values()) == INITIAL_BALANCE * ACCOUNT_COUNT
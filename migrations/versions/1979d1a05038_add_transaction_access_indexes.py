@@ -0,0 +1,38 @@
+"""add_transaction_access_indexes
+
+Revision ID: 1979d1a05038
+Revises: 62d989dba361
+Create Date: 2026-10-17 09:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1979d1a05038'
+down_revision: Union[str, None] = '62d989dba361'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so existing transaction rows stay writable.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_transaction_sender_account_id_created_at', 'transaction', ['sender_account_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transaction_receiver_account_id_created_at', 'transaction', ['receiver_account_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transaction_sender_id_created_at', 'transaction', ['sender_id', 'created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transaction_receiver_id_created_at', 'transaction', ['receiver_id', 'created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transaction_pending_created_at', 'transaction', ['created_at'], unique=False, postgresql_where=sa.text("status = 'Pending'"), postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transaction_pending_created_at', table_name='transaction', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transaction_receiver_id_created_at', table_name='transaction', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transaction_sender_id_created_at', table_name='transaction', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transaction_receiver_account_id_created_at', table_name='transaction', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transaction_sender_account_id_created_at', table_name='transaction', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,53 @@
+"""convert_balances_to_numeric
+
+Revision ID: b7e3c41f9a26
+Revises: 1979d1a05038
+Create Date: 2026-10-17 11:48:03.512907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c41f9a26'
+down_revision: Union[str, None] = '1979d1a05038'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONEY_COLUMNS = [
+    ('bankaccount', 'balance', False),
+    ('virtualcard', 'available_balance', False),
+    ('virtualcard', 'total_topped_up', False),
+    ('virtualcard', 'total_spend_today', False),
+    ('virtualcard', 'total_spend_this_month', False),
+    ('virtualcard', 'last_transaction_amount', True),
+]
+
+
+def upgrade() -> None:
+    for table_name, column_name, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=sa.Float(),
+            type_=sa.Numeric(precision=20, scale=2),
+            existing_nullable=nullable,
+            postgresql_using=f'round({column_name}::numeric, 2)',
+        )
+
+
+def downgrade() -> None:
+    for table_name, column_name, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=sa.Numeric(precision=20, scale=2),
+            type_=sa.Float(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column_name}::double precision',
+        )
@@ -0,0 +1,29 @@
+"""add_idempotency_key_expires_at_index
+
+Revision ID: c4d8e2a17f53
+Revises: b7e3c41f9a26
+Create Date: 2026-10-17 14:06:27.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2a17f53'
+down_revision: Union[str, None] = 'b7e3c41f9a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_idempotencykey_expires_at', 'idempotencykey', ['expires_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_idempotencykey_expires_at', table_name='idempotencykey', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,38 @@
+"""add_email_outbox_table
+
+Revision ID: d5e9f3b28a64
+Revises: c4d8e2a17f53
+Create Date: 2026-10-17 16:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e9f3b28a64'
+down_revision: Union[str, None] = 'c4d8e2a17f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('emailoutbox',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('status', sa.Enum('Pending', 'Failed', name='emailoutboxstatusenum'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_emailoutbox_pending_created_at', 'emailoutbox', ['created_at'], unique=False, postgresql_where=sa.text("status = 'Pending'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emailoutbox_pending_created_at', table_name='emailoutbox', postgresql_where=sa.text("status = 'Pending'"))
+    op.drop_table('emailoutbox')
+    sa.Enum(name='emailoutboxstatusenum').drop(op.get_bind(), checkfirst=True)